@@ -125,6 +125,30 @@ class D_Packet(ctypes.Structure):
             rows.append(row)
         return rows
 
+    def get_row(self, index: int) -> list[str]:
+        """Return a single row, copying only its offsets and payload slice.
+
+        Negative indices count from the end, as with a list.
+        """
+        n, cols = self.row_count, self.col_count
+        try:
+            i = range(max(n, 0))[index]
+        except IndexError:
+            raise IndexError(f"Row index {index} out of range") from None
+        if cols <= 0 or not self.row_data:
+            return []
+
+        # cols+1 offsets bound this row's cells inside the flat row_data buffer.
+        off_addr = ctypes.cast(self.row_offsets, ctypes.c_void_p).value
+        offsets = array.array("i")
+        offsets.frombytes(ctypes.string_at(off_addr + i * cols * 4, (cols + 1) * 4))
+        base = offsets[0]
+        data = ctypes.string_at(self.row_data + base, offsets[cols] - base)
+        return [
+            data[offsets[j] - base:offsets[j + 1] - base].decode(errors="replace")
+            for j in range(cols)
+        ]
+
     def get_schema(self) -> list[dict]:
         return self.schema.as_list()
 
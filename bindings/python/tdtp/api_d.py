@@ -71,6 +71,14 @@ class PacketHandle:
         """Return all data rows as a list of string lists."""
         return self.pkt.get_rows()
 
+    def get_row(self, index: int) -> list[str]:
+        """Return one data row without decoding the rest (negative index OK).
+
+        Raises:
+            IndexError: if index is out of range.
+        """
+        return self.pkt.get_row(index)
+
     def get_schema(self) -> list[dict]:
         """Return schema field descriptors."""
         return self.pkt.get_schema()
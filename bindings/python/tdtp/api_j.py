@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 from tdtp._loader import lib, free_string
 from tdtp.exceptions import (
@@ -31,6 +32,15 @@ from tdtp.exceptions import (
     TDTPWriteError,
 )
 
+# Optional fast JSON decoder — orjson parses the result bytes directly and is
+# several times faster than the stdlib on multi-MB J_read payloads.
+# Install with `pip install tdtp[fast]`; the stdlib json is the fallback.
+try:
+    import orjson as _orjson
+    _json_loads = _orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Map the Go error_code (single source of truth, see exports_j.go errorCodeFor)
 # → specific exception type. This is the primary, stable mapping.
 _ERROR_CODE_MAP: dict[str, type[TDTPError]] = {
@@ -75,7 +85,7 @@ def _call(fn, *args) -> dict:
     raw_bytes = ctypes.string_at(raw_ptr)   # read C string by address
     free_string(raw_ptr)                     # release Go-allocated memory
 
-    result = json.loads(raw_bytes)
+    result = _json_loads(raw_bytes)
 
     err_msg = result.get("error", "")
     if err_msg:
@@ -713,6 +723,35 @@ class TDTPClientJSON:
         from tdtp.pandas_ext import pandas_to_data
         return pandas_to_data(df, table_name=table_name, message_id=message_id)
 
+    def J_from_arrow(self, table: "pa.Table", table_name: str = "data", message_id: str = "") -> dict:
+        """Convert a ``pyarrow.Table`` to a TDTP data dict.
+
+        Columnar counterpart of :meth:`J_from_pandas`: numeric columns are
+        serialised with numpy in one pass per column instead of per cell.
+        Delegates to :func:`tdtp.arrow_ext.arrow_to_data`.
+
+        Args:
+            table:      ``pyarrow.Table`` to convert.
+            table_name: table name written into the TDTP header.
+            message_id: TDTP ``MessageID``. If empty, a UUID4 is generated.
+
+        Returns:
+            dict with ``"schema"``, ``"header"``, and ``"data"`` keys.
+
+        Raises:
+            ImportError: if pyarrow or numpy is not installed.
+
+        Example::
+
+            import pyarrow as pa
+            client = TDTPClientJSON()
+            tbl    = pa.Table.from_pandas(df, preserve_index=False)
+            data   = client.J_from_arrow(tbl, table_name="users")
+            client.J_export_all(data, "out/users.tdtp.xml", compress=True)
+        """
+        from tdtp.arrow_ext import arrow_to_data
+        return arrow_to_data(table, table_name=table_name, message_id=message_id)
+
     # -----------------------------------------------------------------------
     # Diff
     # -----------------------------------------------------------------------
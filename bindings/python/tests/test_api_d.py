@@ -41,6 +41,17 @@ class TestDRead:
             assert len(rows) == SAMPLE_TOTAL_ROWS
             assert all(len(r) == len(SAMPLE_FIELD_NAMES) for r in rows)
 
+    def test_get_row_matches_get_rows(self, d_client, sample_tdtp_path) -> None:
+        with d_client.D_read_ctx(str(sample_tdtp_path)) as h:
+            rows = h.get_rows()
+            assert h.get_row(0) == rows[0]
+            assert h.get_row(-1) == rows[-1]
+
+    def test_get_row_out_of_range_raises(self, d_client, sample_tdtp_path) -> None:
+        with d_client.D_read_ctx(str(sample_tdtp_path)) as h:
+            with pytest.raises(IndexError):
+                h.get_row(SAMPLE_TOTAL_ROWS)
+
     def test_nonexistent_file_raises(self, d_client) -> None:
         with pytest.raises(TDTPParseError):
             d_client.D_read("/no/such/file.tdtp")
@@ -201,6 +201,14 @@ class TestArrowWrite:
         assert d1["schema"] == d2["schema"]
         assert d1["data"] == d2["data"]
 
+    def test_j_from_arrow_matches_arrow_to_data(self, j_client, typed_table) -> None:
+        """TDTPClientJSON.J_from_arrow should produce identical output to arrow_to_data."""
+        from tdtp.arrow_ext import arrow_to_data
+        d1 = arrow_to_data(typed_table, table_name="t", message_id="fixed-id")
+        d2 = j_client.J_from_arrow(typed_table, table_name="t", message_id="fixed-id")
+        assert d1["schema"] == d2["schema"]
+        assert d1["data"] == d2["data"]
+
     def test_write_arrow_empty_table(self, db, tmp_path) -> None:
         empty = pa.table({"A": pa.array([], type=pa.int64())})
         f = tmp_path / "empty.tdtp.xml"
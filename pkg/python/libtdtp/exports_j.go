@@ -8,7 +8,9 @@ import (
 	"encoding/json"
 	"fmt"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
 	"unsafe"
 
 	"github.com/ruslano69/tdtp-framework/pkg/core/packet"
@@ -404,30 +406,68 @@ func jExportAll(dataJSON *C.char, basePath *C.char, optionsJSON *C.char) *C.char
 	}
 
 	base := C.GoString(basePath)
-	written := make([]string, 0, len(packets))
+	written := make([]string, len(packets))
+	errs := make([]error, len(packets))
 
-	for i, pkt := range packets {
+	exportPart := func(i int) error {
+		pkt := packets[i]
 		// Compact must run before compression: it rewrites Data.Rows with
 		// carry-forward gaps for fixed fields. Applied per-part so each part
 		// stays independently decodable (carry-forward resets per packet).
 		if compact {
 			fixed := packet.ResolveFixedFields(pkt.Schema, explicitFixed)
 			if len(fixed) > 0 {
+				// All parts share one Schema.Fields backing array and
+				// ApplyCompact edits it in place — give this part its own copy.
+				pkt.Schema.Fields = append([]packet.Field(nil), pkt.Schema.Fields...)
 				if err := packet.ApplyCompact(pkt, fixed, compactTail); err != nil {
-					return jErr(fmt.Sprintf("compress part %d: %v", i+1, err))
+					return fmt.Errorf("compress part %d: %w", i+1, err)
 				}
 			}
 		}
 		if compress {
 			if err := compressAndSign(pkt, algo, level, withChecksum); err != nil {
-				return jErr(fmt.Sprintf("compress part %d: %v", i+1, err))
+				return fmt.Errorf("compress part %d: %w", i+1, err)
 			}
 		}
 		fname := generateExportFilename(base, i+1, len(packets))
 		if err := gen.WriteToFile(pkt, fname); err != nil {
-			return jErr(fmt.Sprintf("write part %d: %v", i+1, err))
+			return fmt.Errorf("write part %d: %w", i+1, err)
+		}
+		written[i] = fname
+		return nil
+	}
+
+	// Parts are independent (own rows, own file, own compressor), so
+	// compact+compress+write runs on all cores. The cgo call has already
+	// released the Python GIL, so no process pool is needed on that side.
+	workers := runtime.NumCPU()
+	if workers > len(packets) {
+		workers = len(packets)
+	}
+	next := make(chan int, len(packets))
+	for i := range packets {
+		next <- i
+	}
+	close(next)
+
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range next {
+				errs[i] = exportPart(i)
+			}
+		}()
+	}
+	wg.Wait()
+
+	// Report the first failing part in part order, as the serial loop did
+	for _, err := range errs {
+		if err != nil {
+			return jErr(err.Error())
 		}
-		written = append(written, fname)
 	}
 
 	return jOK(map[string]any{
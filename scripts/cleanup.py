@@ -14,26 +14,87 @@ Options:
 
 import os
 import sys
-import shutil
-import subprocess
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
 
+# Temporary files and build artifacts, matched by exact entry name...
+TEMP_NAMES = {
+    # Build artifacts
+    'dist': 'Build artifact',
+    'build': 'Build artifact',
+    '__pycache__': 'Python cache',
+    '.pytest_cache': 'Pytest cache',
+
+    # IDE
+    '.vscode': 'VS Code settings',
+    '.idea': 'IntelliJ settings',
+
+    # OS
+    '.DS_Store': 'macOS metadata',
+    'Thumbs.db': 'Windows thumbnails',
+}
+
+# ...or by suffix
+TEMP_SUFFIXES = {
+    '.pyc': 'Python bytecode',
+    '.egg-info': 'Python egg info',
+
+    # Temporary
+    '.tmp': 'Temporary file',
+    '.temp': 'Temporary file',
+    '.log': 'Log file',
+    '.bak': 'Backup file',
+}
+
+DB_SUFFIXES = {'.db', '.sqlite'}
+
+# Never descended into: VCS metadata and dependency trees the cleaner
+# does not own (and that can be huge)
+SKIP_DIRS = {'.git', 'node_modules', '.venv', 'venv'}
+
+# unlink/rmtree spend their time in syscalls with the GIL released,
+# so removals overlap well across threads
+REMOVE_WORKERS = 8
+
+
+def _dir_size(path: str) -> int:
+    """Total size of regular files under path.
+
+    DirEntry caches the type from the directory listing, so each entry
+    costs at most one stat() and no Path object.
+    """
+    total = 0
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                total += _dir_size(entry.path)
+    return total
+
+
 class ProjectCleaner:
     def __init__(self, project_root: Path, dry_run: bool = False):
         self.project_root = project_root
         self.dry_run = dry_run
         self.removed_count = 0
         self.removed_size = 0
+        self._scan = None
+        self._lock = threading.Lock()
+        # Relative paths for the log are a string slice, not Path.relative_to
+        self._root_prefix = str(project_root) + os.sep
+        self._log: List[str] = []
 
     def get_size(self, path: Path) -> int:
         """Get size of file or directory in bytes"""
         if path.is_file():
             return path.stat().st_size
         elif path.is_dir():
-            return sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+            return _dir_size(path)
         return 0
 
     def remove_path(self, path: Path, reason: str):
@@ -44,52 +105,73 @@ class ProjectCleaner:
         size = self.get_size(path)
         size_mb = size / (1024 * 1024)
 
-        if self.dry_run:
-            print(f"[DRY-RUN] Would remove: {path.relative_to(self.project_root)} ({size_mb:.2f} MB) - {reason}")
-        else:
-            print(f"Removing: {path.relative_to(self.project_root)} ({size_mb:.2f} MB) - {reason}")
+        rel_path = str(path).removeprefix(self._root_prefix)
+
+        # Log buffer and counters are shared with other remove_paths workers
+        with self._lock:
+            if self.dry_run:
+                self._log.append(f"[DRY-RUN] Would remove: {rel_path} ({size_mb:.2f} MB) - {reason}")
+            else:
+                self._log.append(f"Removing: {rel_path} ({size_mb:.2f} MB) - {reason}")
+            self.removed_count += 1
+            self.removed_size += size
+
+        if not self.dry_run:
             if path.is_dir():
+                import shutil
                 shutil.rmtree(path)
             else:
                 path.unlink()
 
-        self.removed_count += 1
-        self.removed_size += size
+    def flush_log(self):
+        """Write the buffered removal log for the current phase in one call"""
+        if self._log:
+            sys.stdout.write('\n'.join(self._log) + '\n')
+            self._log.clear()
+
+    def remove_paths(self, items: List[Tuple[Path, str]]):
+        """Remove many (path, reason) pairs concurrently"""
+        with ThreadPoolExecutor(max_workers=REMOVE_WORKERS) as executor:
+            list(executor.map(lambda item: self.remove_path(*item), items))
+
+    def scan_tree(self) -> Tuple[List[Tuple[Path, str]], List[Path]]:
+        """Walk the project once and classify every entry.
+
+        Returns (temp_hits, db_hits). Matched directories are not descended
+        into, since they are removed as a whole. The result is cached so the
+        cleaning phases share a single walk.
+        """
+        if self._scan is not None:
+            return self._scan
+
+        temp_hits: List[Tuple[Path, str]] = []
+        db_hits: List[Path] = []
+
+        def classify(root: str, name: str) -> bool:
+            ext = os.path.splitext(name)[1]
+            reason = TEMP_NAMES.get(name) or TEMP_SUFFIXES.get(ext)
+            if reason:
+                temp_hits.append((Path(root, name), reason))
+                return True
+            if ext in DB_SUFFIXES:
+                db_hits.append(Path(root, name))
+                return True
+            return False
+
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not classify(root, d)]
+            for name in files:
+                classify(root, name)
+
+        self._scan = (temp_hits, db_hits)
+        return self._scan
 
     def clean_temp_files(self):
         """Remove temporary files and build artifacts"""
         print("\n=== Cleaning Temporary Files ===")
 
-        temp_patterns = [
-            # Build artifacts
-            ('**/dist', 'Build artifact'),
-            ('**/build', 'Build artifact'),
-            ('**/__pycache__', 'Python cache'),
-            ('**/*.pyc', 'Python bytecode'),
-            ('**/.pytest_cache', 'Pytest cache'),
-            ('**/*.egg-info', 'Python egg info'),
-
-            # IDE
-            ('**/.vscode', 'VS Code settings'),
-            ('**/.idea', 'IntelliJ settings'),
-
-            # OS
-            ('**/.DS_Store', 'macOS metadata'),
-            ('**/Thumbs.db', 'Windows thumbnails'),
-
-            # Temporary
-            ('**/*.tmp', 'Temporary file'),
-            ('**/*.temp', 'Temporary file'),
-            ('**/*.log', 'Log file'),
-            ('**/*.bak', 'Backup file'),
-        ]
-
-        for pattern, reason in temp_patterns:
-            for path in self.project_root.glob(pattern):
-                # Skip .git directory
-                if '.git' in path.parts:
-                    continue
-                self.remove_path(path, reason)
+        temp_hits, _ = self.scan_tree()
+        self.remove_paths(temp_hits)
 
     def clean_old_docker_configs(self):
         """Remove conflicting docker-compose files"""
@@ -125,13 +207,8 @@ class ProjectCleaner:
         """Remove test SQLite databases"""
         print("\n=== Cleaning Test Databases ===")
 
-        for db_file in self.project_root.rglob('*.db'):
-            if '.git' not in db_file.parts:
-                self.remove_path(db_file, 'Test database')
-
-        for db_file in self.project_root.rglob('*.sqlite'):
-            if '.git' not in db_file.parts:
-                self.remove_path(db_file, 'Test database')
+        _, db_hits = self.scan_tree()
+        self.remove_paths([(db_file, 'Test database') for db_file in db_hits])
 
     def stop_docker_containers(self):
         """Stop and remove old Docker containers"""
@@ -141,24 +218,35 @@ class ProjectCleaner:
             print("[DRY-RUN] Would stop and remove all Docker containers")
             return
 
+        # Only needed with --docker; kept off the default startup path
+        import subprocess
+
         try:
-            # List all containers
+            # Only running containers need an explicit kill - stopped ones
+            # are removed by prune directly
             result = subprocess.run(
-                ['docker', 'ps', '-aq'],
+                ['docker', 'ps', '-q'],
                 capture_output=True,
                 text=True,
                 check=False
             )
-
-            if result.returncode == 0 and result.stdout.strip():
-                container_ids = result.stdout.strip().split('\n')
-                print(f"Found {len(container_ids)} containers to remove")
-
-                # Stop all
-                subprocess.run(['docker', 'stop'] + container_ids, check=False)
-                # Remove all
-                subprocess.run(['docker', 'rm'] + container_ids, check=False)
-
+            if result.returncode != 0:
+                print(f"⚠ Could not list Docker containers: {result.stderr.strip()}")
+                return
+
+            running_ids = result.stdout.split()
+            if running_ids:
+                print(f"Killing {len(running_ids)} running containers")
+                subprocess.run(['docker', 'kill'] + running_ids,
+                               stdout=subprocess.DEVNULL, check=False)
+
+            # Remove all stopped containers in one daemon round trip; prune
+            # lists the removed IDs under "Deleted Containers:"
+            result = subprocess.run(['docker', 'container', 'prune', '-f'],
+                                    capture_output=True, text=True, check=False)
+            pruned = 'Deleted Containers:' in result.stdout
+
+            if running_ids or pruned:
                 print("✓ All Docker containers stopped and removed")
             else:
                 print("No Docker containers found")
@@ -176,10 +264,14 @@ class ProjectCleaner:
         print(f"Mode: {'DRY-RUN' if self.dry_run else 'LIVE'}")
         print(f"{'='*60}")
 
-        self.clean_temp_files()
-        self.clean_old_docker_configs()
-        self.clean_old_frontend_dist()
-        self.clean_test_databases()
+        for phase in (
+            self.clean_temp_files,
+            self.clean_old_docker_configs,
+            self.clean_old_frontend_dist,
+            self.clean_test_databases,
+        ):
+            phase()
+            self.flush_log()
 
         if clean_docker:
             self.stop_docker_containers()
@@ -4,15 +4,24 @@
 Создает SQLite БД с 100k записей для тестирования производительности
 """
 
+import array
 import sqlite3
-import random
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install numpy")
+    sys.exit(1)
 
 # Конфигурация
 DB_FILE = "benchmark_100k.db"
 TOTAL_RECORDS = 100000
 
+# Один и тот же текст запроса - попадание в кэш подготовленных выражений
+INSERT_SQL = "INSERT INTO Users (Name, Email, City, Balance, IsActive, RegisteredAt) VALUES (?, ?, ?, ?, ?, ?)"
+
 # Списки для генерации данных
 FIRST_NAMES = [
     "Alexander", "Dmitry", "Sergey", "Alexey", "Ivan", "Mikhail", "Andrey",
@@ -34,49 +43,52 @@ CITIES = [
 
 DOMAINS = ["mail.ru", "gmail.com", "yandex.ru", "outlook.com", "inbox.ru"]
 
+# Нижний регистр для email - считается один раз, а не на каждой строке
+FIRST_LOWER = [n.lower() for n in FIRST_NAMES]
+LAST_LOWER = [n.lower() for n in LAST_NAMES]
 
-def generate_name():
-    """Генерирует случайное имя"""
-    first = random.choice(FIRST_NAMES)
-    last = random.choice(LAST_NAMES)
-    return f"{first} {last}"
 
-
-def generate_email(name, idx):
-    """Генерирует email на основе имени"""
-    parts = name.lower().split()
-    domain = random.choice(DOMAINS)
+def generate_email(fi, li, idx, domain):
+    """Генерирует email по индексам имени и фамилии"""
     # Используем индекс записи для гарантии уникальности
-    return f"{parts[0]}.{parts[1]}.{idx}@{domain}"
+    return FIRST_LOWER[fi] + "." + LAST_LOWER[li] + "." + str(idx) + "@" + domain
 
 
-def generate_balance():
-    """Генерирует баланс с реалистичным распределением"""
+def generate_balances(rng, n):
+    """Генерирует балансы с реалистичным распределением (векторно)"""
     # 70% - положительный баланс
     # 20% - около нуля
     # 10% - отрицательный
-    rand = random.random()
-    if rand < 0.7:
-        return round(random.uniform(100, 100000), 2)
-    elif rand < 0.9:
-        return round(random.uniform(-100, 100), 2)
-    else:
-        return round(random.uniform(-10000, -100), 2)
+    rand = rng.random(n)
+    balances = np.where(
+        rand < 0.7, rng.uniform(100, 100000, n),
+        np.where(rand < 0.9, rng.uniform(-100, 100, n), rng.uniform(-10000, -100, n)),
+    )
+    return balances.round(2)
 
 
-def generate_date():
-    """Генерирует дату регистрации за последние 5 лет"""
-    days_ago = random.randint(0, 365 * 5)
-    date = datetime.now() - timedelta(days=days_ago)
-    return date.strftime("%Y-%m-%d %H:%M:%S")
+def generate_dates(rng, n):
+    """Генерирует даты регистрации за последние 5 лет (векторно)"""
+    # Вся колонка - одна операция над datetime64 вместо n объектов datetime
+    now = np.datetime64(datetime.now().replace(microsecond=0), "s")
+    days_ago = rng.integers(0, 365 * 5 + 1, n).astype("timedelta64[D]")
+    dates = np.datetime_as_string(now - days_ago, unit="s")
+    return np.char.replace(dates, "T", " ").tolist()
 
 
 def create_database():
     """Создает БД и таблицу"""
     print(f"Создание БД: {DB_FILE}")
     
-    conn = sqlite3.connect(DB_FILE)
+    conn = sqlite3.connect(DB_FILE, cached_statements=128)
     cursor = conn.cursor()
+
+    # Настройки массовой загрузки: без fsync на каждый коммит,
+    # временные структуры и кэш страниц (~200 MB) в памяти
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-200000")
     
     # Удаляем таблицу если существует
     cursor.execute("DROP TABLE IF EXISTS Users")
@@ -86,7 +98,7 @@ def create_database():
         CREATE TABLE Users (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
             Name TEXT NOT NULL,
-            Email TEXT NOT NULL UNIQUE,
+            Email TEXT NOT NULL,  -- уникальность: idx_email после загрузки
             City TEXT NOT NULL,
             Balance REAL NOT NULL,
             IsActive INTEGER NOT NULL,
@@ -94,65 +106,78 @@ def create_database():
         )
     """)
     
-    # Создаем индексы для ускорения запросов
-    cursor.execute("CREATE INDEX idx_balance ON Users(Balance)")
-    cursor.execute("CREATE INDEX idx_city ON Users(City)")
-    cursor.execute("CREATE INDEX idx_active ON Users(IsActive)")
-    cursor.execute("CREATE INDEX idx_registered ON Users(RegisteredAt)")
-    
     conn.commit()
     print("✓ Таблица Users создана")
-    print("✓ Индексы созданы")
     
     return conn
 
 
-def insert_records(conn, batch_size=1000):
-    """Вставляет записи пакетами"""
+def create_indexes(conn):
+    """Создает индексы после загрузки данных.
+
+    Индекс строится одной сортировкой по готовой таблице вместо
+    обновления B-дерева на каждой из 100k вставок. Уникальность Email
+    обеспечивает idx_email.
+    """
     cursor = conn.cursor()
-    
+    cursor.executescript("""
+        CREATE UNIQUE INDEX idx_email ON Users(Email);
+        CREATE INDEX idx_balance ON Users(Balance);
+        CREATE INDEX idx_city ON Users(City);
+        CREATE INDEX idx_active ON Users(IsActive);
+        CREATE INDEX idx_registered ON Users(RegisteredAt);
+    """)
+    conn.commit()
+    print("✓ Индексы созданы")
+
+
+def insert_records(conn):
+    """Вставляет записи одним executemany в одной транзакции.
+
+    Случайные величины генерируются одним вызовом NumPy на колонку,
+    а не 6+ вызовами random на каждую строку. Строки отдаются в
+    executemany генератором - список кортежей не материализуется.
+    """
     print(f"\nГенерация {TOTAL_RECORDS:,} записей...")
     print("Прогресс: ", end="", flush=True)
-    
-    records = []
-    for i in range(1, TOTAL_RECORDS + 1):
-        name = generate_name()
-        email = generate_email(name, i)
-        city = random.choice(CITIES)
-        balance = generate_balance()
-        is_active = 1 if random.random() < 0.7 else 0  # 70% активных
-        registered_at = generate_date()
-        
-        records.append((name, email, city, balance, is_active, registered_at))
-        
-        # Вставка пакетами
-        if len(records) >= batch_size:
-            try:
-                cursor.executemany(
-                    "INSERT INTO Users (Name, Email, City, Balance, IsActive, RegisteredAt) VALUES (?, ?, ?, ?, ?, ?)",
-                    records
-                )
-                conn.commit()
-                records = []
-                
-                # Прогресс-бар
-                progress = int((i / TOTAL_RECORDS) * 50)
-                print(f"\rПрогресс: [{'=' * progress}{' ' * (50 - progress)}] {i:,}/{TOTAL_RECORDS:,}", end="", flush=True)
-            
-            except sqlite3.IntegrityError:
-                # Пропускаем дубликаты email
-                records = []
-    
-    # Вставка остатка
-    if records:
-        try:
-            cursor.executemany(
-                "INSERT INTO Users (Name, Email, City, Balance, IsActive, RegisteredAt) VALUES (?, ?, ?, ?, ?, ?)",
-                records
+
+    n = TOTAL_RECORDS
+    rng = np.random.default_rng()
+    fn_idx = rng.integers(0, len(FIRST_NAMES), n).tolist()
+    ln_idx = rng.integers(0, len(LAST_NAMES), n).tolist()
+    city_idx = rng.integers(0, len(CITIES), n).tolist()
+    domain_idx = rng.integers(0, len(DOMAINS), n).tolist()
+    # Числовые колонки - плоские буферы array.array без объекта на элемент;
+    # Python-числа создаются лениво при чтении в генераторе строк
+    balances = array.array("d")
+    balances.frombytes(generate_balances(rng, n).astype(np.float64).tobytes())
+    is_active = array.array("b")
+    is_active.frombytes((rng.random(n) < 0.7).astype(np.int8).tobytes())  # 70% активных
+    registered_at = generate_dates(rng, n)
+
+    def rows():
+        for k, (fi, li) in enumerate(zip(fn_idx, ln_idx)):
+            yield (
+                FIRST_NAMES[fi] + " " + LAST_NAMES[li],
+                generate_email(fi, li, k + 1, DOMAINS[domain_idx[k]]),
+                CITIES[city_idx[k]],
+                balances[k],
+                is_active[k],
+                registered_at[k],
             )
-            conn.commit()
-        except sqlite3.IntegrityError:
-            pass
+
+            # Прогресс-бар
+            done = k + 1
+            if done % 10000 == 0 or done == n:
+                progress = int((done / n) * 50)
+                print(f"\rПрогресс: [{'=' * progress}{' ' * (50 - progress)}] {done:,}/{n:,}", end="", flush=True)
+
+    # Email уникален по построению (индекс записи в адресе), поэтому
+    # при загрузке нет ни UNIQUE-проверки, ни обработки IntegrityError
+    conn.executemany(INSERT_SQL, rows())
+
+    # Единственный коммит на всю загрузку
+    conn.commit()
     
     print("\n✓ Записи вставлены")
 
@@ -211,6 +236,9 @@ def main():
         
         # Вставка данных
         insert_records(conn)
+
+        # Индексы - после загрузки
+        create_indexes(conn)
         
         # Статистика
         print_statistics(conn)
@@ -220,6 +248,9 @@ def main():
         # Вакуум для оптимизации (после закрытия)
         print("\nОптимизация БД...")
         conn2 = sqlite3.connect(DB_FILE)
+        # WAL нужен только на время загрузки - возвращаем обычный журнал,
+        # чтобы файл БД был самодостаточным для бенчмарков
+        conn2.execute("PRAGMA journal_mode=DELETE")
         conn2.execute("VACUUM")
         conn2.close()
         print("✓ БД оптимизирована")
@@ -12,13 +12,40 @@
 
 import psycopg2
 from psycopg2 import sql
-import random
+from psycopg2.extras import execute_values
 from datetime import datetime, timedelta
+import csv
+import io
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import json
-import uuid
+import os
+import socket
+import struct
+import sys
 
-# Fixed seed for reproducible test data
-random.seed(42)
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install numpy")
+    sys.exit(1)
+
+# orjson (опционально) сериализует JSONB-поля в несколько раз быстрее
+try:
+    import orjson
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_dumps = json.dumps
+
+# Загрузка данных через COPY; False - многострочные INSERT ... VALUES
+# (например, для прокси/пулеров без поддержки COPY)
+USE_COPY = True
+
+# COPY в бинарном формате: сервер не разбирает текст чисел, UUID и JSON.
+# False - текстовый COPY в CSV
+COPY_BINARY = True
 
 # Параметры подключения (из docker-compose.yml)
 DB_CONFIG = {
@@ -29,6 +56,26 @@ DB_CONFIG = {
     'database': 'tdtp_test'
 }
 
+THEMES = ('light', 'dark', 'auto')
+LANGUAGES = ('en', 'ru', 'de', 'fr')
+CATEGORIES = ('Electronics', 'Books', 'Clothing', 'Food', 'Toys', 'Sports', 'Home', 'Garden')
+TAGS = ('urgent', 'gift', 'wholesale', 'express', 'fragile')
+
+# Все возможные наборы категорий (1-3 из 8) и тегов заказа (0-3 из 5),
+# сгруппированные по размеру: {k: [[...], ...]}
+CATEGORY_SUBSETS = {k: [list(c) for c in itertools.combinations(CATEGORIES, k)] for k in (1, 2, 3)}
+TAG_SUBSETS = {k: [list(c) for c in itertools.combinations(TAGS, k)] for k in (0, 1, 2, 3)}
+
+# Все 24 варианта metadata.preferences сериализуются один раз при загрузке модуля
+PREFERENCES_JSON = {
+    (theme, language, notifications): json_dumps({
+        'theme': theme,
+        'language': language,
+        'notifications': notifications
+    })
+    for theme in THEMES for language in LANGUAGES for notifications in (True, False)
+}
+
 def create_connection():
     """Создает подключение к PostgreSQL"""
     try:
@@ -38,6 +85,162 @@ def create_connection():
         print(f"❌ Ошибка подключения: {e}")
         return None
 
+def generate_uuids(n):
+    """Генерирует n случайных UUID v4 одним вызовом os.urandom.
+
+    Биты версии и варианта выставляются срезами по всему буферу сразу;
+    результат - 32-символьные hex-строки, которые PostgreSQL принимает
+    как UUID без дефисов.
+    """
+    raw = bytearray(os.urandom(16 * n))
+    raw[6::16] = bytes(b & 0x0F | 0x40 for b in raw[6::16])  # версия 4
+    raw[8::16] = bytes(b & 0x3F | 0x80 for b in raw[8::16])  # вариант RFC 4122
+    hexed = raw.hex()
+    return [hexed[i:i + 32] for i in range(0, 32 * n, 32)]
+
+def pick(rng, values, n):
+    """n случайных элементов values одним вызовом NumPy.
+
+    Результат ссылается на те же объекты строк из values, а не на n
+    новых копий, как при rng.choice по массиву строк.
+    """
+    return np.array(values, dtype=object)[rng.integers(0, len(values), n)].tolist()
+
+def pick_subsets(rng, subsets, n):
+    """n случайных наборов из заранее построенных подмножеств.
+
+    Размер набора и набор данного размера равновероятны - то же
+    распределение, что у random.sample(items, k=random.randint(...)),
+    но без выборки и нового списка на каждую строку.
+    """
+    sizes = list(subsets)
+    size_idx = rng.integers(0, len(sizes), n).tolist()
+    fractions = rng.random(n).tolist()
+    result = []
+    for s, x in zip(size_idx, fractions):
+        group = subsets[sizes[s]]
+        result.append(group[int(x * len(group))])
+    return result
+
+def pg_array(items):
+    """Литерал массива PostgreSQL ({a,b,c}) для простых слов без кавычек"""
+    return '{' + ','.join(items) + '}'
+
+# Бинарный формат COPY: заголовок (сигнатура, флаги, длина расширения)
+# и завершающий маркер -1 вместо числа полей
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+TEXT_OID = 25
+
+def _bin_numeric(value):
+    """NUMERIC с двумя знаками после запятой: цифры по основанию 10000"""
+    cents = round(value * 100)
+    sign = 0x4000 if cents < 0 else 0x0000
+    int_part, frac = divmod(abs(cents), 100)
+    digits = []
+    while int_part:
+        int_part, digit = divmod(int_part, 10000)
+        digits.insert(0, digit)
+    weight = len(digits) - 1
+    digits.append(frac * 100)
+    return struct.pack(f'>hhhh{len(digits)}h', len(digits), weight, sign, 2, *digits)
+
+def _bin_text_array(items):
+    """Одномерный TEXT[]: размерность, флаг NULL, OID элемента, границы, элементы"""
+    if not items:
+        return struct.pack('>iii', 0, 0, TEXT_OID)
+    parts = [struct.pack('>iiiii', 1, 0, TEXT_OID, len(items), 1)]
+    for item in items:
+        data = item.encode()
+        parts.append(struct.pack('>i', len(data)) + data)
+    return b''.join(parts)
+
+# Тип колонки -> функция кодирования значения в бинарный формат COPY
+BINARY_ENCODERS = {
+    'uuid': bytes.fromhex,
+    'text': str.encode,
+    'bool': lambda v: b'\x01' if v else b'\x00',
+    'int2': lambda v: struct.pack('>h', v),
+    'int4': lambda v: struct.pack('>i', v),
+    'int8': lambda v: struct.pack('>q', v),
+    'float4': lambda v: struct.pack('>f', v),
+    'numeric': _bin_numeric,
+    'jsonb': lambda v: b'\x01' + v.encode(),  # версия формата jsonb
+    'inet': lambda v: b'\x02\x20\x00\x04' + socket.inet_aton(v),  # IPv4 /32
+    'text[]': _bin_text_array,
+}
+
+def copy_rows_binary(cursor, table, columns, rows):
+    """Загружает строки одним COPY FROM STDIN в бинарном формате.
+
+    rows - любой итерируемый объект (обычно генератор): строки кодируются
+    по одной, список кортежей не материализуется.
+    """
+    names = ', '.join(name for name, _ in columns)
+    encoders = [BINARY_ENCODERS[pgtype] for _, pgtype in columns]
+    field_count = struct.pack('>h', len(columns))
+    # Строки дописываются в один растущий буфер по мере генерации
+    buf = bytearray(PGCOPY_HEADER)
+    for row in rows:
+        buf += field_count
+        for encode, value in zip(encoders, row):
+            if value is None:
+                buf += b'\xff\xff\xff\xff'  # длина -1 = NULL
+            else:
+                data = encode(value)
+                buf += struct.pack('>i', len(data))
+                buf += data
+    buf += PGCOPY_TRAILER
+    cursor.copy_expert(
+        f"COPY {table} ({names}) FROM STDIN WITH (FORMAT binary)",
+        io.BytesIO(buf)
+    )
+
+def copy_rows(cursor, table, columns, rows):
+    """Загружает строки одним COPY FROM STDIN вместо INSERT на каждую строку.
+
+    Строки сериализуются в CSV в памяти: None -> NULL, JSONB передается
+    готовым текстом, списки для TEXT[] - литералами {a,b}.
+    """
+    names = ', '.join(name for name, _ in columns)
+    arrays = [i for i, (_, pgtype) in enumerate(columns) if pgtype == 'text[]']
+    if arrays:
+        rows = (
+            [pg_array(v) if i in arrays else v for i, v in enumerate(row)]
+            for row in rows
+        )
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({names}) FROM STDIN WITH (FORMAT csv)",
+        buf
+    )
+
+def insert_rows(cursor, table, columns, rows):
+    """Загружает строки пачками INSERT ... VALUES (...),(...) через execute_values"""
+    names = ', '.join(name for name, _ in columns)
+    execute_values(
+        cursor,
+        f"INSERT INTO {table} ({names}) VALUES %s",
+        rows,
+        page_size=500
+    )
+
+def load_rows(cursor, table, columns, rows):
+    """Загружает строки в таблицу выбранным способом (см. USE_COPY, COPY_BINARY).
+
+    columns - пары (имя колонки, тип), тип выбирает кодировщик для
+    бинарного COPY (BINARY_ENCODERS). rows - итерируемый объект строк,
+    загрузчики передают генераторы.
+    """
+    if not USE_COPY:
+        insert_rows(cursor, table, columns, rows)
+    elif COPY_BINARY:
+        copy_rows_binary(cursor, table, columns, rows)
+    else:
+        copy_rows(cursor, table, columns, rows)
+
 def create_test_tables(conn):
     """Создает тестовые таблицы со специфичными типами PostgreSQL"""
     cursor = conn.cursor()
@@ -60,13 +263,14 @@ def create_test_tables(conn):
     """)
     
     # Таблица 2: Заказы с SERIAL и ARRAY
+    # (UNIQUE order_number и FK user_id добавляет finalize_schema после загрузки)
     print("📋 Creating table: orders...")
     cursor.execute("""
         DROP TABLE IF EXISTS orders CASCADE;
         CREATE TABLE orders (
             order_id SERIAL PRIMARY KEY,
-            user_id UUID REFERENCES users(id),
-            order_number VARCHAR(50) UNIQUE NOT NULL,
+            user_id UUID,
+            order_number VARCHAR(50) NOT NULL,
             total_amount NUMERIC(15, 2) NOT NULL,
             status VARCHAR(20) DEFAULT 'pending',
             tags TEXT[] DEFAULT '{}',
@@ -76,12 +280,13 @@ def create_test_tables(conn):
     """)
     
     # Таблица 3: Продукты с различными числовыми типами
+    # (UNIQUE sku добавляет finalize_schema после загрузки)
     print("📋 Creating table: products...")
     cursor.execute("""
         DROP TABLE IF EXISTS products CASCADE;
         CREATE TABLE products (
             product_id BIGSERIAL PRIMARY KEY,
-            sku VARCHAR(50) UNIQUE NOT NULL,
+            sku VARCHAR(50) NOT NULL,
             name VARCHAR(200) NOT NULL,
             description TEXT,
             price NUMERIC(10, 2) NOT NULL,
@@ -149,136 +354,244 @@ def create_test_tables(conn):
     cursor.close()
     print("✅ Tables created successfully")
 
-def generate_test_data(conn, num_users=100, num_products=50, num_orders=200):
-    """Генерирует тестовые данные"""
-    cursor = conn.cursor()
+def load_users(cursor, seed, user_ids):
+    """Генерирует и загружает пользователей"""
+    rng = np.random.default_rng(seed)
+    n = len(user_ids)
+    themes = pick(rng, THEMES, n)
+    languages = pick(rng, LANGUAGES, n)
+    notifications = (rng.random(n) < 0.5).tolist()
+    login_counts = rng.integers(1, 1001, n).tolist()
+    ages = rng.integers(18, 81, n).tolist()
+    balances = rng.uniform(0, 10000, n).round(2).tolist()
+    active = (rng.random(n) < 0.75).tolist()  # 75% активных
     
-    print(f"\n📊 Generating test data...")
-    print(f"   Users: {num_users}")
-    print(f"   Products: {num_products}")
-    print(f"   Orders: {num_orders}")
+    last_login = datetime.now().isoformat()  # одна метка на всю загрузку
     
-    # Генерация пользователей
-    print("\n👥 Inserting users...")
-    user_ids = []
-    for i in range(num_users):
-        user_uuid = str(uuid.uuid4())  # Конвертируем UUID в строку для PostgreSQL
-        user_ids.append(user_uuid)
-        
-        metadata = {
-            'preferences': {
-                'theme': random.choice(['light', 'dark', 'auto']),
-                'language': random.choice(['en', 'ru', 'de', 'fr']),
-                'notifications': random.choice([True, False])
-            },
-            'last_login': datetime.now().isoformat(),
-            'login_count': random.randint(1, 1000)
-        }
-        
-        cursor.execute("""
-            INSERT INTO users (id, username, email, age, balance, is_active, metadata)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            user_uuid,
-            f'user_{i+1}',
-            f'user{i+1}@example.com',
-            random.randint(18, 80),
-            round(random.uniform(0, 10000), 2),
-            random.choice([True, True, True, False]),  # 75% активных
-            json.dumps(metadata)
-        ))
+    def user_rows():
+        for i, user_uuid in enumerate(user_ids):
+            preferences = PREFERENCES_JSON[themes[i], languages[i], notifications[i]]
+            metadata = (
+                f'{{"preferences": {preferences}, '
+                f'"last_login": "{last_login}", '
+                f'"login_count": {login_counts[i]}}}'
+            )
+            
+            yield (
+                user_uuid,
+                f'user_{i+1}',
+                f'user{i+1}@example.com',
+                ages[i],
+                balances[i],
+                active[i],
+                metadata
+            )
+    load_rows(cursor, 'users',
+              (('id', 'uuid'), ('username', 'text'), ('email', 'text'),
+               ('age', 'int2'), ('balance', 'numeric'), ('is_active', 'bool'),
+               ('metadata', 'jsonb')),
+              user_rows())
+
+def load_products(cursor, seed, product_ids):
+    """Генерирует и загружает продукты с заранее выделенными идентификаторами"""
+    rng = np.random.default_rng(seed)
+    n = len(product_ids)
+    categories = pick_subsets(rng, CATEGORY_SUBSETS, n)
+    lengths = rng.uniform(10, 100, n).round(2).tolist()
+    widths = rng.uniform(10, 100, n).round(2).tolist()
+    heights = rng.uniform(5, 50, n).round(2).tolist()
+    prices = rng.uniform(9.99, 999.99, n).round(2).tolist()
+    quantities = rng.integers(0, 1001, n).tolist()
+    weights = rng.uniform(0.1, 50.0, n).round(2).tolist()
+    available = (rng.random(n) < 0.75).tolist()
     
-    # Генерация продуктов
-    print("📦 Inserting products...")
-    product_ids = []
-    categories_list = ['Electronics', 'Books', 'Clothing', 'Food', 'Toys', 'Sports', 'Home', 'Garden']
+    def product_rows():
+        for i in range(n):
+            dimensions = {
+                'length': lengths[i],
+                'width': widths[i],
+                'height': heights[i],
+                'unit': 'cm'
+            }
+            
+            yield (
+                product_ids[i],
+                f'SKU-{1000+i}',
+                f'Product {i+1}',
+                f'Description for product {i+1}',
+                prices[i],
+                quantities[i],
+                weights[i],
+                json_dumps(dimensions),
+                categories[i],
+                available[i]
+            )
+    load_rows(cursor, 'products',
+              (('product_id', 'int8'), ('sku', 'text'), ('name', 'text'),
+               ('description', 'text'), ('price', 'numeric'), ('quantity', 'int4'),
+               ('weight', 'float4'), ('dimensions', 'jsonb'),
+               ('categories', 'text[]'), ('is_available', 'bool')),
+              product_rows())
+
+def load_orders(cursor, seed, user_ids, product_ids, num_orders):
+    """Генерирует и загружает заказы"""
+    rng = np.random.default_rng(seed)
+    # Позиции всех заказов - одним плоским массивом, заказ i занимает
+    # срез item_starts[i]:item_starts[i+1]
+    order_users = rng.integers(0, len(user_ids), num_orders).tolist()
+    num_items = rng.integers(1, 6, num_orders)
+    item_starts = np.concatenate(([0], np.cumsum(num_items)))
+    total_items = int(item_starts[-1])
+    item_products = rng.integers(0, len(product_ids), total_items)
+    item_quantities = rng.integers(1, 4, total_items)
+    item_prices = rng.uniform(10, 500, total_items).round(2)
+    totals = np.add.reduceat(item_prices * item_quantities, item_starts[:-1]).round(2).tolist()
+    tags = pick_subsets(rng, TAG_SUBSETS, num_orders)
+    statuses = pick(rng, ('pending', 'processing', 'shipped', 'delivered', 'cancelled'), num_orders)
+    item_products = item_products.tolist()
+    item_quantities = item_quantities.tolist()
+    item_prices = item_prices.tolist()
+    item_starts = item_starts.tolist()
     
-    for i in range(num_products):
-        dimensions = {
-            'length': round(random.uniform(10, 100), 2),
-            'width': round(random.uniform(10, 100), 2),
-            'height': round(random.uniform(5, 50), 2),
-            'unit': 'cm'
-        }
-        
-        cursor.execute("""
-            INSERT INTO products (sku, name, description, price, quantity, weight, dimensions, categories, is_available)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING product_id
-        """, (
-            f'SKU-{1000+i}',
-            f'Product {i+1}',
-            f'Description for product {i+1}',
-            round(random.uniform(9.99, 999.99), 2),
-            random.randint(0, 1000),
-            round(random.uniform(0.1, 50.0), 2),
-            json.dumps(dimensions),
-            random.sample(categories_list, k=random.randint(1, 3)),
-            random.choice([True, True, True, False])
-        ))
-        product_ids.append(cursor.fetchone()[0])
+    def order_rows():
+        for i in range(num_orders):
+            items = [
+                {
+                    'product_id': product_ids[item_products[j]],
+                    'quantity': item_quantities[j],
+                    'price': item_prices[j]
+                }
+                for j in range(item_starts[i], item_starts[i + 1])
+            ]
+            
+            yield (
+                user_ids[order_users[i]],
+                f'ORD-{10000+i}',
+                totals[i],
+                statuses[i],
+                tags[i],
+                json_dumps(items)
+            )
+    load_rows(cursor, 'orders',
+              (('user_id', 'uuid'), ('order_number', 'text'),
+               ('total_amount', 'numeric'), ('status', 'text'),
+               ('tags', 'text[]'), ('items', 'jsonb')),
+              order_rows())
+
+def load_activity(cursor, seed, user_ids, num_logs):
+    """Генерирует и загружает логи активности"""
+    rng = np.random.default_rng(seed)
+    actions = ['login', 'logout', 'view_product', 'add_to_cart', 'purchase', 'update_profile']
+    log_users = rng.integers(0, len(user_ids), num_logs).tolist()
+    log_actions = pick(rng, actions, num_logs)
+    days_ago = rng.integers(0, 366, num_logs).tolist()
+    # Различных дат всего 366 - форматируем каждую один раз
+    now = datetime.now()
+    timestamps = [(now - timedelta(days=d)).isoformat() for d in range(366)]
+    agents = pick(rng, ('Chrome', 'Firefox', 'Safari', 'Edge'), num_logs)
+    # Все октеты адресов - один буфер байтов, каждые 4 байта форматирует inet_ntoa
+    ip_bytes = rng.integers(1, 256, num_logs * 4, dtype=np.uint8).tobytes()
+    ips = [socket.inet_ntoa(ip_bytes[k:k + 4]) for k in range(0, num_logs * 4, 4)]
     
-    # Генерация заказов
-    print("🛒 Inserting orders...")
-    for i in range(num_orders):
-        user_id = random.choice(user_ids)
-        num_items = random.randint(1, 5)
-        
-        items = []
-        total = 0
-        for _ in range(num_items):
-            product_id = random.choice(product_ids)
-            quantity = random.randint(1, 3)
-            price = round(random.uniform(10, 500), 2)
-            total += price * quantity
+    def log_rows():
+        for i in range(num_logs):
+            action = log_actions[i]
             
-            items.append({
-                'product_id': product_id,
-                'quantity': quantity,
-                'price': price
-            })
-        
-        tags = random.sample(['urgent', 'gift', 'wholesale', 'express', 'fragile'], k=random.randint(0, 3))
-        
-        cursor.execute("""
-            INSERT INTO orders (user_id, order_number, total_amount, status, tags, items)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (
-            user_id,
-            f'ORD-{10000+i}',
-            round(total, 2),
-            random.choice(['pending', 'processing', 'shipped', 'delivered', 'cancelled']),
-            tags,
-            json.dumps(items)
-        ))
+            details = {
+                'action': action,
+                'timestamp': timestamps[days_ago[i]],
+                'user_agent': agents[i]
+            }
+            
+            yield (
+                user_ids[log_users[i]],
+                action,
+                json_dumps(details),
+                ips[i]
+            )
+    load_rows(cursor, 'activity_logs',
+              (('user_id', 'uuid'), ('action', 'text'), ('details', 'jsonb'),
+               ('ip_address', 'inet')),
+              log_rows())
+
+def run_loader(loader, *args):
+    """Выполняет загрузчик в отдельном процессе на своем подключении"""
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        cursor = conn.cursor()
+        # Загрузка таблицы - одна транзакция; тестовую БД не нужно
+        # ждать с fsync WAL при фиксации
+        cursor.execute("SET LOCAL synchronous_commit = OFF")
+        loader(cursor, *args)
+        conn.commit()
+    finally:
+        conn.close()
+
+def generate_test_data(conn, num_users=100, num_products=50, num_orders=200):
+    """Генерирует тестовые данные.
+
+    Случайные величины генерируются одним вызовом NumPy на колонку,
+    циклы только собирают кортежи строк из готовых списков.
+
+    Идентификаторы пользователей и продуктов выделяются заранее, а
+    FOREIGN KEY добавляет finalize_schema после загрузки, поэтому все
+    четыре таблицы независимы и загружаются параллельно - каждая в своем
+    процессе и на своем подключении (backend PostgreSQL).
+    """
+    print(f"\n📊 Generating test data...")
+    print(f"   Users: {num_users}")
+    print(f"   Products: {num_products}")
+    print(f"   Orders: {num_orders}")
     
-    # Генерация логов активности
-    print("📝 Inserting activity logs...")
-    actions = ['login', 'logout', 'view_product', 'add_to_cart', 'purchase', 'update_profile']
-    for i in range(num_orders * 3):  # Больше логов чем заказов
-        user_id = random.choice(user_ids)
-        action = random.choice(actions)
-        
-        details = {
-            'action': action,
-            'timestamp': (datetime.now() - timedelta(days=random.randint(0, 365))).isoformat(),
-            'user_agent': random.choice(['Chrome', 'Firefox', 'Safari', 'Edge'])
-        }
-        
-        cursor.execute("""
-            INSERT INTO activity_logs (user_id, action, details, ip_address)
-            VALUES (%s, %s, %s, %s)
-        """, (
-            user_id,
-            action,
-            json.dumps(details),
-            f'{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}'
-        ))
+    user_ids = generate_uuids(num_users)
     
+    # Идентификаторы продуктов берём из последовательности одним запросом,
+    # чтобы заказы могли ссылаться на них без RETURNING на каждую строку
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT nextval('products_product_id_seq') FROM generate_series(1, %s)",
+        (num_products,)
+    )
+    product_ids = [row[0] for row in cursor.fetchall()]
     conn.commit()
     cursor.close()
+    
+    # Fixed seed for reproducible test data: независимый поток
+    # случайных чисел для каждого загрузчика
+    seeds = np.random.SeedSequence(42).spawn(4)
+    jobs = [
+        (load_users, seeds[0], user_ids),
+        (load_products, seeds[1], product_ids),
+        (load_orders, seeds[2], user_ids, product_ids, num_orders),
+        (load_activity, seeds[3], user_ids, num_orders * 3),  # Больше логов чем заказов
+    ]
+    print("\n🚚 Loading users, products, orders and activity logs in parallel...")
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(run_loader, *job) for job in jobs]
+        for future in futures:
+            future.result()
+    
     print("✅ Test data inserted successfully")
 
+def finalize_schema(conn):
+    """Добавляет UNIQUE и FOREIGN KEY ограничения после загрузки данных.
+
+    Индекс строится одной сортировкой по заполненной таблице, FK проверяется
+    одним проходом - вместо поддержки B-дерева и проверки на каждой строке.
+    Имена ограничений совпадают с теми, что PostgreSQL дал бы в CREATE TABLE.
+    """
+    cursor = conn.cursor()
+    print("\n🔗 Adding constraints...")
+    cursor.execute("""
+        ALTER TABLE products ADD CONSTRAINT products_sku_key UNIQUE (sku);
+        ALTER TABLE orders ADD CONSTRAINT orders_order_number_key UNIQUE (order_number);
+        ALTER TABLE orders ADD CONSTRAINT orders_user_id_fkey
+            FOREIGN KEY (user_id) REFERENCES users(id);
+    """)
+    conn.commit()
+    cursor.close()
+    print("✅ Constraints added")
+
 def print_statistics(conn):
     """Выводит статистику по таблицам"""
     cursor = conn.cursor()
@@ -287,15 +600,12 @@ def print_statistics(conn):
     print("=" * 60)
     
     tables = ['users', 'products', 'orders', 'activity_logs']
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        count = cursor.fetchone()[0]
-        
-        cursor.execute(f"""
-            SELECT pg_size_pretty(pg_total_relation_size('{table}'))
-        """)
-        size = cursor.fetchone()[0]
-        
+    # Счетчики и размеры всех таблиц - одним запросом
+    cursor.execute(" UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*), pg_size_pretty(pg_total_relation_size('{table}')) FROM {table}"
+        for table in tables
+    ))
+    for table, count, size in cursor.fetchall():
         print(f"  {table:20} | Rows: {count:6} | Size: {size}")
     
     print("=" * 60)
@@ -361,6 +671,9 @@ def main():
             num_orders=200
         )
         
+        # Ограничения - после загрузки
+        finalize_schema(conn)
+        
         # Статистика
         print_statistics(conn)
         
@@ -24,7 +24,13 @@ def create_test_database(db_file="testdata/test.db"):
     # Подключаемся
     conn = sqlite3.connect(db_file)
     cursor = conn.cursor()
-    
+
+    # БД пересоздается с нуля при каждом запуске - гарантии
+    # сохранности (fsync, журнал на диске) здесь не нужны
+    cursor.execute("PRAGMA synchronous = OFF")
+    cursor.execute("PRAGMA journal_mode = MEMORY")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+
     # Создаем таблицу Users
     print("Creating table: Users")
     cursor.execute("""
@@ -131,16 +137,14 @@ def create_test_database(db_file="testdata/test.db"):
     print("Database created successfully!")
     print("="*60)
     
-    cursor.execute("SELECT COUNT(*) FROM Users")
-    users_count = cursor.fetchone()[0]
+    cursor.execute("""
+        SELECT (SELECT COUNT(*) FROM Users),
+               (SELECT COUNT(*) FROM Orders),
+               (SELECT COUNT(*) FROM Products)
+    """)
+    users_count, orders_count, products_count = cursor.fetchone()
     print(f"Users: {users_count} records")
-    
-    cursor.execute("SELECT COUNT(*) FROM Orders")
-    orders_count = cursor.fetchone()[0]
     print(f"Orders: {orders_count} records")
-    
-    cursor.execute("SELECT COUNT(*) FROM Products")
-    products_count = cursor.fetchone()[0]
     print(f"Products: {products_count} records")
     
     print("="*60)
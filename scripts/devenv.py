@@ -18,19 +18,99 @@ Commands:
     db-check - Check database connections
 """
 
+import io
 import os
 import sys
 import time
+import shutil
+import tempfile
 import subprocess
 import argparse
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+# Concurrent `docker pull`s before `up`; capped to stay clear of registry rate limits
+PULL_WORKERS = 4
+
+# Printed by start() in a single write
+SERVICES_SUMMARY = (
+    "\n✓ Environment started successfully!\n"
+    "\nServices available at:\n"
+    "  • RabbitMQ Management: http://localhost:15672 (tdtp_test/tdtp_test_password)\n"
+    "  • Adminer:            http://localhost:8080\n"
+    "  • MSSQL:              localhost:1433 (sa/YourStrong!Passw0rd)\n"
+    "  • PostgreSQL:         localhost:5432 (tdtp_test/tdtp_test_password)\n"
+    "  • MySQL:              localhost:3306 (tdtp_test/tdtp_test_password)\n"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def docker_available() -> bool:
+    """Check once per process that the docker CLI exists and the daemon answers"""
+    try:
+        result = subprocess.run(['docker', 'version', '--format', '{{.Server.Version}}'],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return False
+    return result.returncode == 0
+
+
+@functools.lru_cache(maxsize=1)
+def compose_command() -> tuple:
+    """Compose CLI to use: standalone docker-compose if installed, else the docker compose plugin"""
+    if shutil.which('docker-compose'):
+        return ('docker-compose',)
+    return ('docker', 'compose')
+
+
+class ThreadBufferedOutput:
+    """Stand-in for sys.stdout while setup tasks run in parallel.
+
+    Output of a thread that called start() is collected in its own buffer
+    and returned by finish(), so each task's log is printed as one block
+    instead of interleaving line by line. Other threads write through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    @property
+    def buffering(self) -> bool:
+        return getattr(self._local, 'buffer', None) is not None
+
+    def start(self):
+        self._local.buffer = io.StringIO()
+
+    def finish(self) -> str:
+        text = self._local.buffer.getvalue()
+        self._local.buffer = None
+        return text
+
+    def write(self, text: str) -> int:
+        if self.buffering:
+            return self._local.buffer.write(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        if not self.buffering:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        # Everything else (isatty, encoding, fileno, buffer, ...) is the
+        # real stream's, so code probing sys.stdout keeps working
+        return getattr(self.stream, name)
 
 
 class DevEnvironment:
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.docker_compose = project_root / 'docker-compose.yml'
+        # Fixed part of every compose invocation, stringified once
+        self._compose_cmd_prefix = (*compose_command(), '-f', str(self.docker_compose))
 
         # Database credentials (from docker-compose.yml)
         self.mssql_password = 'YourStrong!Passw0rd'
@@ -39,12 +119,37 @@ class DevEnvironment:
         self.mysql_user = 'tdtp_test'
         self.mysql_password = 'tdtp_test_password'
 
-    def run_command(self, cmd: List[str], check: bool = True, capture: bool = False) -> Optional[subprocess.CompletedProcess]:
-        """Run shell command"""
+        # Client invocations that read SQL from stdin, shared by the setup_* methods
+        self._sqlcmd_stdin = ('docker', 'exec', '-i', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
+                              '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password, '-C')
+        self._psql_stdin = ('docker', 'exec', '-i', 'tdtp-postgres-test', 'psql',
+                            '-U', self.postgres_user, '-d', 'tdtp_test_db')
+
+        # Containers known to accept connections; the lock per container
+        # keeps concurrent setups from running the same wait twice
+        self._ready = set()
+        self._ready_locks = {'tdtp-mssql-test': threading.Lock(), 'tdtp-postgres-test': threading.Lock()}
+
+    def run_command(self, cmd: List[str], check: bool = True, capture: bool = False,
+                    discard: bool = False) -> Optional[subprocess.CompletedProcess]:
+        """Run shell command
+
+        capture returns the output as text; discard sends it to DEVNULL for
+        callers that only look at the return code (no pipes, no decoding).
+        """
         try:
             if capture:
                 result = subprocess.run(cmd, check=check, capture_output=True, text=True)
                 return result
+            elif discard:
+                return subprocess.run(cmd, check=check, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elif isinstance(sys.stdout, ThreadBufferedOutput) and sys.stdout.buffering:
+                # Parallel setup: route the command's output into the task's buffer
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                sys.stdout.write(result.stdout + result.stderr)
+                if check:
+                    result.check_returncode()
+                return None
             else:
                 subprocess.run(cmd, check=check)
                 return None
@@ -57,9 +162,17 @@ class DevEnvironment:
             print(f"  Make sure Docker/docker-compose is installed and in PATH")
             return None
 
+    def require_docker(self) -> bool:
+        """Report and return False if Docker is unavailable (probed once, see docker_available)"""
+        if docker_available():
+            return True
+        print("✗ Docker is not available")
+        print("  Make sure Docker is installed, in PATH and the daemon is running")
+        return False
+
     def docker_compose_cmd(self, *args) -> List[str]:
         """Build docker-compose command"""
-        return ['docker-compose', '-f', str(self.docker_compose)] + list(args)
+        return [*self._compose_cmd_prefix, *args]
 
     def start(self):
         """Start Docker environment"""
@@ -70,27 +183,82 @@ class DevEnvironment:
             print(f"  Run: python scripts/setup_config.py first")
             return False
 
+        if not self.require_docker():
+            return False
+
+        self.pull_images()
+
         print("Starting Docker containers...")
         cmd = self.docker_compose_cmd('up', '-d')
         if self.run_command(cmd) is None:
             return False
 
         print("\nWaiting for containers to be healthy...")
-        time.sleep(5)
+        if not self.wait_healthy():
+            print("⚠ Some containers are not healthy yet - check status below")
 
         # Check status
         self.status()
 
-        print("\n✓ Environment started successfully!")
-        print("\nServices available at:")
-        print("  • RabbitMQ Management: http://localhost:15672 (tdtp_test/tdtp_test_password)")
-        print("  • Adminer:            http://localhost:8080")
-        print("  • MSSQL:              localhost:1433 (sa/YourStrong!Passw0rd)")
-        print("  • PostgreSQL:         localhost:5432 (tdtp_test/tdtp_test_password)")
-        print("  • MySQL:              localhost:3306 (tdtp_test/tdtp_test_password)")
+        sys.stdout.write(SERVICES_SUMMARY)
+        sys.stdout.flush()
 
         return True
 
+    def pull_images(self):
+        """Pull the compose images that are not present locally, in parallel.
+
+        `up` would otherwise pull missing images one after another. Images
+        already present cost one `docker image inspect` each. Failures are
+        only reported - `up` retries the pull and shows the real error.
+        """
+        result = self.run_command(self.docker_compose_cmd('config', '--images'), check=False, capture=True)
+        if not result or result.returncode != 0:
+            return
+        images = sorted(set(result.stdout.split()))
+        if not images:
+            return
+
+        def pull(image: str) -> Optional[bool]:
+            inspect = self.run_command(['docker', 'image', 'inspect', image], check=False, discard=True)
+            if inspect and inspect.returncode == 0:
+                return None
+            pulled = self.run_command(['docker', 'pull', '--quiet', image], check=False, discard=True)
+            return bool(pulled and pulled.returncode == 0)
+
+        with ThreadPoolExecutor(max_workers=min(PULL_WORKERS, len(images))) as executor:
+            outcomes = list(executor.map(pull, images))
+
+        for image, pulled in zip(images, outcomes):
+            if pulled is True:
+                print(f"✓ Pulled {image}")
+            elif pulled is False:
+                print(f"⚠ Could not pull {image}")
+
+    def wait_healthy(self, timeout: float = 120.0, interval: float = 0.2) -> bool:
+        """Wait until every compose container is healthy.
+
+        Containers without a healthcheck only need to be running. Polls one
+        `docker inspect` for all containers per interval, so start() returns
+        as soon as the slowest container is ready instead of after a fixed sleep.
+        """
+        result = self.run_command(self.docker_compose_cmd('ps', '-q'), check=False, capture=True)
+        container_ids = result.stdout.split() if result and result.returncode == 0 else []
+        if not container_ids:
+            return False
+
+        fmt = '{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}'
+        deadline = time.monotonic() + timeout
+        while True:
+            result = self.run_command(['docker', 'inspect', '--format', fmt] + container_ids,
+                                      check=False, capture=True)
+            states = result.stdout.split() if result and result.returncode == 0 else []
+            if states and all(state in ('healthy', 'running') for state in states):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
     def stop(self):
         """Stop Docker environment"""
         print("\n=== Stopping TDTP Development Environment ===\n")
@@ -125,38 +293,141 @@ class DevEnvironment:
             cmd.append('-f')
         self.run_command(cmd, check=False)
 
-    def setup_mssql_database(self):
-        """Setup MSSQL TravelGuide database"""
-        print("\n--- Setting up MSSQL TravelGuide Database ---")
+    def run_sql_stream(self, cmd: Sequence[str], preamble: str, script_path: Path) -> bool:
+        """Feed SQL to a client inside a container through one `docker exec -i`.
+
+        The preamble is written first, then the script file is copied into
+        the child's stdin as raw bytes - with os.sendfile where available, so
+        the file contents never pass through Python. Client output is not
+        read; stderr goes to a temporary file so a chatty client cannot block
+        on a full pipe while we are still writing.
+        """
+        with open(script_path, 'rb') as script, tempfile.TemporaryFile() as errors:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=errors)
+            try:
+                proc.stdin.write(preamble.encode())
+                proc.stdin.flush()
+                offset = 0
+                size = os.fstat(script.fileno()).st_size
+                try:
+                    while offset < size:
+                        sent = os.sendfile(proc.stdin.fileno(), script.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except BrokenPipeError:
+                    raise
+                except (AttributeError, OSError):
+                    # No sendfile (e.g. Windows) or not supported for this pair of fds
+                    script.seek(offset)
+                    shutil.copyfileobj(script, proc.stdin)
+                proc.stdin.close()
+            except BrokenPipeError:
+                # The client exited early; its stderr tells why
+                pass
+            proc.wait()
+
+            if proc.returncode != 0:
+                errors.seek(0)
+                print(f"✗ SQL script failed: {errors.read().decode(errors='replace')}")
+                return False
+
+        print("✓ SQL script executed successfully")
+        return True
+
+    def run_python_script(self, script: Path) -> bool:
+        """Run a populate script in its own interpreter.
+
+        A child process keeps each script's __main__, sys.argv and module
+        state to itself, so the parallel setups can run their scripts at
+        the same time. The output is captured and written to the calling
+        setup's output buffer. Failures are reported, not raised, like
+        check=False.
+        """
+        result = self.run_command([sys.executable, str(script)], check=False, capture=True)
+        if result is None:
+            return False
+        sys.stdout.write(result.stdout + result.stderr)
+        if result.returncode != 0:
+            print(f"✗ {script.name} exited with {result.returncode}")
+            return False
+        return True
+
+    def container_running(self, container: str) -> bool:
+        """Whether a container exists and is running (one inspect call, no container list scan)"""
+        result = self.run_command(['docker', 'container', 'inspect', '--format', '{{.State.Running}}', container],
+                                  check=False, capture=True)
+        return bool(result and result.returncode == 0 and result.stdout.strip() == 'true')
 
-        # Check if container is running
-        result = self.run_command(['docker', 'ps', '--filter', 'name=tdtp-mssql-test', '--format', '{{.Names}}'],
-                                   capture=True)
-        if not result or 'tdtp-mssql-test' not in result.stdout:
+    def container_health(self, container: str) -> Optional[str]:
+        """Healthcheck status of a container ('starting', 'healthy', ...), None if it has none"""
+        result = self.run_command(
+            ['docker', 'inspect', '--format', '{{if .State.Health}}{{.State.Health.Status}}{{end}}', container],
+            check=False, capture=True
+        )
+        if result and result.returncode == 0:
+            return result.stdout.strip() or None
+        return None
+
+    def wait_ready(self, container: str, probe: List[str], timeout: float = 120.0) -> bool:
+        """Wait until the probe command succeeds inside a container.
+
+        Each attempt first asks `docker inspect` for the compose healthcheck
+        status (a cheap API call) and only runs the real probe once it reports
+        healthy. The delay between attempts backs off from 250ms to 2s.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while time.monotonic() - started < timeout:
+            if self.container_health(container) in ('healthy', None):
+                result = self.run_command(probe, check=False, discard=True)
+                if result and result.returncode == 0:
+                    return True
+
+            time.sleep(min(2.0, 0.25 * 1.5 ** attempt))
+            attempt += 1
+            if attempt % 10 == 0:
+                print(f"  Still waiting... ({time.monotonic() - started:.0f}s)")
+        return False
+
+    def _ensure_ready(self, container: str) -> bool:
+        """Wait for a database container once; later calls return the cached result"""
+        if container in self._ready:
+            return True
+        with self._ready_locks[container]:
+            if container in self._ready:
+                return True
+            wait = self.wait_mssql_ready if container == 'tdtp-mssql-test' else self.wait_postgres_ready
+            if not wait():
+                return False
+            self._ready.add(container)
+            return True
+
+    def wait_mssql_ready(self) -> bool:
+        """Check that the MSSQL container is running and wait until it accepts queries"""
+        if not self.container_running('tdtp-mssql-test'):
             print("✗ MSSQL container not running. Start environment first.")
             return False
 
         # Wait for MSSQL to be ready
         print("Waiting for MSSQL to be ready...")
-        max_attempts = 60  # 2 minutes
-        for i in range(max_attempts):
-            result = self.run_command(
-                ['docker', 'exec', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
-                 '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password, '-Q', 'SELECT 1', '-C'],
-                check=False, capture=True
-            )
-            if result and result.returncode == 0:
-                print("✓ MSSQL is ready")
-                break
-
-            if (i + 1) % 10 == 0:
-                print(f"  Still waiting... ({i + 1}/{max_attempts})")
-
-            time.sleep(2)
-        else:
+        if not self.wait_ready(
+            'tdtp-mssql-test',
+            ['docker', 'exec', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
+             '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password, '-Q', 'SELECT 1', '-C']
+        ):
             print("✗ MSSQL failed to become ready after 2 minutes")
             print("  Check logs: docker logs tdtp-mssql-test")
             return False
+        print("✓ MSSQL is ready")
+        return True
+
+    def setup_mssql_database(self):
+        """Setup MSSQL TravelGuide database"""
+        print("\n--- Setting up MSSQL TravelGuide Database ---")
+
+        if not self.require_docker() or not self._ensure_ready('tdtp-mssql-test'):
+            return False
 
         # Run setup script
         setup_sql = self.project_root / 'examples' / 'travel-guide' / 'setup_database.sql'
@@ -166,52 +437,43 @@ class DevEnvironment:
 
         print(f"Running {setup_sql.name}...")
 
-        # Execute SQL via stdin
-        with open(setup_sql, 'r') as f:
-            proc = subprocess.Popen(
-                ['docker', 'exec', '-i', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
-                 '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password, '-C'],
-                stdin=f,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = proc.communicate()
-
-            if proc.returncode != 0:
-                print(f"✗ SQL script failed: {stderr}")
-                return False
-
-            print("✓ SQL script executed successfully")
+        if not self.run_sql_stream(self._sqlcmd_stdin, '', setup_sql):
+            return False
 
         # Load data with Python script
         populate_script = self.project_root / 'examples' / 'travel-guide' / 'populate_data.py'
         if populate_script.exists():
             print(f"Loading data with {populate_script.name}...")
-            self.run_command(['python3', str(populate_script)], check=False)
+            self.run_python_script(populate_script)
 
         print("✓ MSSQL TravelGuide database setup complete")
         return True
 
+    def wait_postgres_ready(self) -> bool:
+        """Check that the PostgreSQL container is running and wait until it accepts connections"""
+        if not self.container_running('tdtp-postgres-test'):
+            print("✗ PostgreSQL container not running. Start environment first.")
+            return False
+
+        # Wait for PostgreSQL to be ready
+        print("Waiting for PostgreSQL to be ready...")
+        if not self.wait_ready(
+            'tdtp-postgres-test',
+            ['docker', 'exec', 'tdtp-postgres-test', 'pg_isready', '-U', self.postgres_user]
+        ):
+            print("✗ PostgreSQL failed to become ready after 2 minutes")
+            print("  Check logs: docker logs tdtp-postgres-test")
+            return False
+        print("✓ PostgreSQL is ready")
+        return True
+
     def setup_postgres_database(self):
         """Setup PostgreSQL TravelGuide database"""
         print("\n--- Setting up PostgreSQL TravelGuide Database ---")
 
-        # Check if container is running
-        result = self.run_command(['docker', 'ps', '--filter', 'name=tdtp-postgres-test', '--format', '{{.Names}}'],
-                                   capture=True)
-        if not result or 'tdtp-postgres-test' not in result.stdout:
-            print("✗ PostgreSQL container not running. Start environment first.")
+        if not self.require_docker() or not self._ensure_ready('tdtp-postgres-test'):
             return False
 
-        # Create database
-        print("Creating TravelGuide database...")
-        self.run_command(
-            ['docker', 'exec', 'tdtp-postgres-test', 'psql', '-U', self.postgres_user,
-             '-d', 'tdtp_test_db', '-c', 'CREATE DATABASE "TravelGuide";'],
-            check=False
-        )
-
         # Run setup script
         setup_sql = self.project_root / 'examples' / 'travel-guide' / 'setup_database_postgres.sql'
         if not setup_sql.exists():
@@ -220,28 +482,17 @@ class DevEnvironment:
 
         print(f"Running {setup_sql.name}...")
 
-        # Execute SQL via stdin
-        with open(setup_sql, 'r') as f:
-            proc = subprocess.Popen(
-                ['docker', 'exec', '-i', 'tdtp-postgres-test', 'psql', '-U', self.postgres_user, '-d', 'TravelGuide'],
-                stdin=f,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = proc.communicate()
-
-            if proc.returncode != 0:
-                print(f"✗ SQL script failed: {stderr}")
-                return False
-
-            print("✓ SQL script executed successfully")
+        # CREATE DATABASE and the setup script go through one psql session;
+        # if the database already exists psql reports the error and goes on
+        preamble = 'CREATE DATABASE "TravelGuide";\n\\connect "TravelGuide"\n'
+        if not self.run_sql_stream(self._psql_stdin, preamble, setup_sql):
+            return False
 
         # Load data with Python script
         populate_script = self.project_root / 'examples' / 'travel-guide' / 'populate_data_postgres.py'
         if populate_script.exists():
             print(f"Loading data with {populate_script.name}...")
-            self.run_command(['python3', str(populate_script)], check=False)
+            self.run_python_script(populate_script)
 
         print("✓ PostgreSQL TravelGuide database setup complete")
         return True
@@ -250,14 +501,8 @@ class DevEnvironment:
         """Setup MSSQL TravelAgency database"""
         print("\n--- Setting up MSSQL TravelAgency Database ---")
 
-        # Create database
-        print("Creating TravelAgency database...")
-        self.run_command(
-            ['docker', 'exec', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
-             '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password,
-             '-Q', 'CREATE DATABASE TravelAgency', '-C'],
-            check=False
-        )
+        if not self.require_docker() or not self._ensure_ready('tdtp-mssql-test'):
+            return False
 
         # Run setup script
         setup_sql = self.project_root / 'examples' / 'travel-agency' / 'setup_database.sql'
@@ -267,28 +512,17 @@ class DevEnvironment:
 
         print(f"Running {setup_sql.name}...")
 
-        with open(setup_sql, 'r') as f:
-            proc = subprocess.Popen(
-                ['docker', 'exec', '-i', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
-                 '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password, '-d', 'TravelAgency', '-C'],
-                stdin=f,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = proc.communicate()
-
-            if proc.returncode != 0:
-                print(f"✗ SQL script failed: {stderr}")
-                return False
-
-            print("✓ SQL script executed successfully")
+        # CREATE DATABASE and the setup script go through one sqlcmd session
+        preamble = ("IF DB_ID(N'TravelAgency') IS NULL CREATE DATABASE TravelAgency\nGO\n"
+                    "USE TravelAgency\nGO\n")
+        if not self.run_sql_stream(self._sqlcmd_stdin, preamble, setup_sql):
+            return False
 
         # Load data
         populate_script = self.project_root / 'examples' / 'travel-agency' / 'populate_data.py'
         if populate_script.exists():
             print(f"Loading data with {populate_script.name}...")
-            self.run_command(['python3', str(populate_script)], check=False)
+            self.run_python_script(populate_script)
 
         print("✓ MSSQL TravelAgency database setup complete")
         return True
@@ -297,13 +531,8 @@ class DevEnvironment:
         """Setup PostgreSQL TravelAgency database"""
         print("\n--- Setting up PostgreSQL TravelAgency Database ---")
 
-        # Create database
-        print("Creating TravelAgency database...")
-        self.run_command(
-            ['docker', 'exec', 'tdtp-postgres-test', 'psql', '-U', self.postgres_user,
-             '-d', 'tdtp_test_db', '-c', 'CREATE DATABASE "TravelAgency";'],
-            check=False
-        )
+        if not self.require_docker() or not self._ensure_ready('tdtp-postgres-test'):
+            return False
 
         # Run setup script
         setup_sql = self.project_root / 'examples' / 'travel-agency' / 'setup_database_postgres.sql'
@@ -313,27 +542,17 @@ class DevEnvironment:
 
         print(f"Running {setup_sql.name}...")
 
-        with open(setup_sql, 'r') as f:
-            proc = subprocess.Popen(
-                ['docker', 'exec', '-i', 'tdtp-postgres-test', 'psql', '-U', self.postgres_user, '-d', 'TravelAgency'],
-                stdin=f,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = proc.communicate()
-
-            if proc.returncode != 0:
-                print(f"✗ SQL script failed: {stderr}")
-                return False
-
-            print("✓ SQL script executed successfully")
+        # CREATE DATABASE and the setup script go through one psql session;
+        # if the database already exists psql reports the error and goes on
+        preamble = 'CREATE DATABASE "TravelAgency";\n\\connect "TravelAgency"\n'
+        if not self.run_sql_stream(self._psql_stdin, preamble, setup_sql):
+            return False
 
         # Load data
         populate_script = self.project_root / 'examples' / 'travel-agency' / 'populate_data_postgres.py'
         if populate_script.exists():
             print(f"Loading data with {populate_script.name}...")
-            self.run_command(['python3', str(populate_script)], check=False)
+            self.run_python_script(populate_script)
 
         print("✓ PostgreSQL TravelAgency database setup complete")
         return True
@@ -342,10 +561,45 @@ class DevEnvironment:
         """Setup all test databases"""
         print("\n=== Setting up Test Databases ===")
 
-        self.setup_mssql_database()
-        self.setup_postgres_database()
-        self.setup_mssql_travelagency()
-        self.setup_postgres_travelagency()
+        # Probe once here so the parallel chains below only hit the cache
+        if not self.require_docker():
+            return
+
+        # Engines are independent and run in parallel. Within an engine the
+        # readiness wait comes first, then both of its databases are set up
+        # concurrently - they only share the server, not any objects
+        engines = [
+            ('tdtp-mssql-test', [self.setup_mssql_database, self.setup_mssql_travelagency]),
+            ('tdtp-postgres-test', [self.setup_postgres_database, self.setup_postgres_travelagency]),
+        ]
+
+        output = ThreadBufferedOutput(sys.stdout)
+        lock = threading.Lock()
+
+        def run_buffered(step) -> bool:
+            # Each step's log is printed as one block once the step is done
+            output.start()
+            try:
+                return step()
+            finally:
+                text = output.finish()
+                with lock:
+                    output.stream.write(text)
+                    output.stream.flush()
+
+        def run_engine(engine):
+            container, setups = engine
+            if not run_buffered(lambda: self._ensure_ready(container)):
+                return
+            with ThreadPoolExecutor(max_workers=len(setups)) as executor:
+                list(executor.map(run_buffered, setups))
+
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+                list(executor.map(run_engine, engines))
+        finally:
+            sys.stdout = output.stream
 
         print("\n✓ All databases setup complete!")
 
@@ -353,42 +607,50 @@ class DevEnvironment:
         """Check database connections"""
         print("\n=== Checking Database Connections ===\n")
 
-        # MSSQL
-        print("MSSQL (localhost:1433):", end=" ")
+        if not self.require_docker():
+            return
+
+        checks = [
+            ("MSSQL (localhost:1433)", 'tdtp-mssql-test',
+             ['docker', 'exec', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
+              '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password,
+              '-d', 'TravelGuide', '-Q', 'SELECT COUNT(*) FROM cities']),
+            ("PostgreSQL (localhost:5432)", 'tdtp-postgres-test',
+             ['docker', 'exec', 'tdtp-postgres-test', 'psql', '-U', self.postgres_user,
+              '-d', 'TravelGuide', '-c', 'SELECT COUNT(*) FROM cities;']),
+            ("MySQL (localhost:3306)", 'tdtp-mysql-test',
+             ['docker', 'exec', 'tdtp-mysql-test', 'mysql', '-u', self.mysql_user,
+              f'-p{self.mysql_password}', '-e', 'SELECT 1']),
+        ]
+
+        # One inspect for all containers: running and healthy (or without a
+        # healthcheck). A missing container makes docker exit non-zero, but
+        # the others are still listed
         result = self.run_command(
-            ['docker', 'exec', 'tdtp-mssql-test', '/opt/mssql-tools18/bin/sqlcmd',
-             '-S', 'localhost', '-U', 'sa', '-P', self.mssql_password,
-             '-d', 'TravelGuide', '-Q', 'SELECT COUNT(*) FROM cities'],
+            ['docker', 'inspect', '--format',
+             '{{.Name}} {{.State.Running}} {{if .State.Health}}{{.State.Health.Status}}{{else}}none{{end}}']
+            + [container for _, container, _ in checks],
             check=False, capture=True
         )
-        if result and result.returncode == 0:
-            print("✓ Connected")
-        else:
-            print("✗ Failed")
+        up = set()
+        for line in (result.stdout.splitlines() if result else []):
+            name, running, health = line.split()
+            if running == 'true' and health in ('healthy', 'none'):
+                up.add(name.lstrip('/'))
+
+        # Real queries only for live containers, all at once
+        def probe(check) -> bool:
+            _, container, cmd = check
+            if container not in up:
+                return False
+            result = self.run_command(cmd, check=False, discard=True)
+            return bool(result and result.returncode == 0)
 
-        # PostgreSQL
-        print("PostgreSQL (localhost:5432):", end=" ")
-        result = self.run_command(
-            ['docker', 'exec', 'tdtp-postgres-test', 'psql', '-U', self.postgres_user,
-             '-d', 'TravelGuide', '-c', 'SELECT COUNT(*) FROM cities;'],
-            check=False, capture=True
-        )
-        if result and result.returncode == 0:
-            print("✓ Connected")
-        else:
-            print("✗ Failed")
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            connected = list(executor.map(probe, checks))
 
-        # MySQL
-        print("MySQL (localhost:3306):", end=" ")
-        result = self.run_command(
-            ['docker', 'exec', 'tdtp-mysql-test', 'mysql', '-u', self.mysql_user,
-             f'-p{self.mysql_password}', '-e', 'SELECT 1'],
-            check=False, capture=True
-        )
-        if result and result.returncode == 0:
-            print("✓ Connected")
-        else:
-            print("✗ Failed")
+        for (label, _, _), ok in zip(checks, connected):
+            print(f"{label}:", "✓ Connected" if ok else "✗ Failed")
 
 
 def main():
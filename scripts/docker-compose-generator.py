@@ -14,16 +14,193 @@ TDTP Framework - Docker Compose Generator
 """
 
 import argparse
+import copy
+import json
 import sys
-import yaml
 from typing import List, Dict, Any
 
+# Сериализатор итогового файла. Основной вариант - PyYAML с C-дампером
+# (libyaml), он на порядок быстрее чисто питоновского. Без libyaml пишем
+# JSON: это валидный YAML, docker compose читает его как есть
+try:
+    import yaml
+    from yaml import CSafeDumper
+
+    def dump_compose(compose: Dict[str, Any]) -> str:
+        return yaml.dump(compose, Dumper=CSafeDumper, default_flow_style=False, sort_keys=False)
+except ImportError:
+    try:
+        import orjson
+
+        def dump_compose(compose: Dict[str, Any]) -> str:
+            return orjson.dumps(compose, option=orjson.OPT_INDENT_2).decode() + "\n"
+    except ImportError:
+        def dump_compose(compose: Dict[str, Any]) -> str:
+            return json.dumps(compose, indent=2, ensure_ascii=False) + "\n"
+
+
+# Общие параметры healthcheck. Проверка каждые 30 секунд, а не 10:
+# у MSSQL это запуск sqlcmd внутри контейнера, частые пробы заметно
+# нагружают хост. start_period - пробы в период старта не засчитываются
+# в retries
+_DEFAULT_HEALTHCHECK = {
+    "interval": "30s",
+    "timeout": "5s",
+    "retries": 5,
+    "start_period": "10s"
+}
+
+# Шаблоны сервисов - константы модуля, собираются один раз при импорте.
+# add_* кладут в services глубокую копию, чтобы правки одного генератора
+# не затрагивали шаблон
+_POSTGRES_SERVICE = {
+    "image": "postgres:16-alpine",
+    "container_name": "tdtp-postgres",
+    "environment": {
+        "POSTGRES_USER": "tdtp",
+        "POSTGRES_PASSWORD": "tdtp_password",
+        "POSTGRES_DB": "tdtp_db"
+    },
+    "ports": ["5432:5432"],
+    "volumes": ["postgres-data:/var/lib/postgresql/data"],
+    "networks": ["tdtp-network"],
+    "healthcheck": {
+        "test": ["CMD-SHELL", "pg_isready -U tdtp"],
+        **_DEFAULT_HEALTHCHECK
+    }
+}
+
+_MYSQL_SERVICE = {
+    "image": "mysql:8.0",
+    "container_name": "tdtp-mysql",
+    "environment": {
+        "MYSQL_ROOT_PASSWORD": "root_password",
+        "MYSQL_DATABASE": "tdtp_db",
+        "MYSQL_USER": "tdtp",
+        "MYSQL_PASSWORD": "tdtp_password"
+    },
+    "ports": ["3306:3306"],
+    "volumes": ["mysql-data:/var/lib/mysql"],
+    "networks": ["tdtp-network"],
+    "healthcheck": {
+        "test": ["CMD", "mysqladmin", "ping", "-h", "localhost"],
+        **_DEFAULT_HEALTHCHECK
+    }
+}
+
+_MSSQL_SERVICE = {
+    "image": "mcr.microsoft.com/mssql/server:2022-latest",
+    "container_name": "tdtp-mssql",
+    "environment": {
+        "ACCEPT_EULA": "Y",
+        "SA_PASSWORD": "TdtpPassword123!",
+        "MSSQL_PID": "Developer"
+    },
+    "ports": ["1433:1433"],
+    "volumes": ["mssql-data:/var/opt/mssql"],
+    "networks": ["tdtp-network"],
+    "healthcheck": {
+        "test": [
+            "CMD-SHELL",
+            "/opt/mssql-tools/bin/sqlcmd -S localhost -U sa -P TdtpPassword123! -Q 'SELECT 1'"
+        ],
+        **_DEFAULT_HEALTHCHECK,
+        # SQL Server поднимается дольше остальных
+        "start_period": "30s"
+    }
+}
+
+_RABBITMQ_SERVICE = {
+    "image": "rabbitmq:3.12-management-alpine",
+    "container_name": "tdtp-rabbitmq",
+    "environment": {
+        "RABBITMQ_DEFAULT_USER": "tdtp",
+        "RABBITMQ_DEFAULT_PASS": "tdtp_password"
+    },
+    "ports": [
+        "5672:5672",   # AMQP
+        "15672:15672"  # Management UI
+    ],
+    "volumes": ["rabbitmq-data:/var/lib/rabbitmq"],
+    "networks": ["tdtp-network"],
+    "healthcheck": {
+        "test": ["CMD", "rabbitmq-diagnostics", "-q", "ping"],
+        **_DEFAULT_HEALTHCHECK
+    }
+}
+
+_ZOOKEEPER_SERVICE = {
+    "image": "confluentinc/cp-zookeeper:7.5.0",
+    "container_name": "tdtp-zookeeper",
+    "environment": {
+        "ZOOKEEPER_CLIENT_PORT": 2181,
+        "ZOOKEEPER_TICK_TIME": 2000
+    },
+    "networks": ["tdtp-network"]
+}
+
+_KAFKA_SERVICE = {
+    "image": "confluentinc/cp-kafka:7.5.0",
+    "container_name": "tdtp-kafka",
+    "depends_on": ["zookeeper"],
+    "environment": {
+        "KAFKA_BROKER_ID": 1,
+        "KAFKA_ZOOKEEPER_CONNECT": "zookeeper:2181",
+        "KAFKA_ADVERTISED_LISTENERS": "PLAINTEXT://localhost:9092",
+        "KAFKA_OFFSETS_TOPIC_REPLICATION_FACTOR": 1,
+        "KAFKA_TRANSACTION_STATE_LOG_MIN_ISR": 1,
+        "KAFKA_TRANSACTION_STATE_LOG_REPLICATION_FACTOR": 1
+    },
+    "ports": ["9092:9092"],
+    "networks": ["tdtp-network"],
+    "healthcheck": {
+        "test": ["CMD", "kafka-broker-api-versions", "--bootstrap-server", "localhost:9092"],
+        **_DEFAULT_HEALTHCHECK,
+        "timeout": "10s"
+    }
+}
+
+_PGADMIN_SERVICE = {
+    "image": "dpage/pgadmin4:latest",
+    "container_name": "tdtp-pgadmin",
+    "environment": {
+        "PGADMIN_DEFAULT_EMAIL": "admin@tdtp.local",
+        "PGADMIN_DEFAULT_PASSWORD": "admin",
+        "PGADMIN_CONFIG_SERVER_MODE": "False"
+    },
+    "ports": ["5050:80"],
+    "networks": ["tdtp-network"],
+    "depends_on": ["postgres"]
+}
+
+_ADMINER_SERVICE = {
+    "image": "adminer:latest",
+    "container_name": "tdtp-adminer",
+    "ports": ["8080:8080"],
+    "networks": ["tdtp-network"],
+    "environment": {
+        "ADMINER_DEFAULT_SERVER": "postgres"
+    }
+}
+
+_KAFKA_UI_SERVICE = {
+    "image": "provectuslabs/kafka-ui:latest",
+    "container_name": "tdtp-kafka-ui",
+    "depends_on": ["kafka"],
+    "ports": ["8081:8080"],
+    "networks": ["tdtp-network"],
+    "environment": {
+        "KAFKA_CLUSTERS_0_NAME": "tdtp-kafka",
+        "KAFKA_CLUSTERS_0_BOOTSTRAPSERVERS": "kafka:9092",
+        "KAFKA_CLUSTERS_0_ZOOKEEPER": "zookeeper:2181"
+    }
+}
+
 
 class DockerComposeGenerator:
     """Генератор docker-compose.yml для TDTP Framework"""
 
     def __init__(self):
-        self.version = "3.8"
         self.services = {}
         self.volumes = {}
         self.networks = {
@@ -34,131 +211,28 @@ class DockerComposeGenerator:
 
     def add_postgres(self):
         """Добавить PostgreSQL"""
-        self.services["postgres"] = {
-            "image": "postgres:16-alpine",
-            "container_name": "tdtp-postgres",
-            "environment": {
-                "POSTGRES_USER": "tdtp",
-                "POSTGRES_PASSWORD": "tdtp_password",
-                "POSTGRES_DB": "tdtp_db"
-            },
-            "ports": ["5432:5432"],
-            "volumes": ["postgres-data:/var/lib/postgresql/data"],
-            "networks": ["tdtp-network"],
-            "healthcheck": {
-                "test": ["CMD-SHELL", "pg_isready -U tdtp"],
-                "interval": "10s",
-                "timeout": "5s",
-                "retries": 5
-            }
-        }
+        self.services["postgres"] = copy.deepcopy(_POSTGRES_SERVICE)
         self.volumes["postgres-data"] = None
 
     def add_mysql(self):
         """Добавить MySQL"""
-        self.services["mysql"] = {
-            "image": "mysql:8.0",
-            "container_name": "tdtp-mysql",
-            "environment": {
-                "MYSQL_ROOT_PASSWORD": "root_password",
-                "MYSQL_DATABASE": "tdtp_db",
-                "MYSQL_USER": "tdtp",
-                "MYSQL_PASSWORD": "tdtp_password"
-            },
-            "ports": ["3306:3306"],
-            "volumes": ["mysql-data:/var/lib/mysql"],
-            "networks": ["tdtp-network"],
-            "healthcheck": {
-                "test": ["CMD", "mysqladmin", "ping", "-h", "localhost"],
-                "interval": "10s",
-                "timeout": "5s",
-                "retries": 5
-            }
-        }
+        self.services["mysql"] = copy.deepcopy(_MYSQL_SERVICE)
         self.volumes["mysql-data"] = None
 
     def add_mssql(self):
         """Добавить Microsoft SQL Server"""
-        self.services["mssql"] = {
-            "image": "mcr.microsoft.com/mssql/server:2022-latest",
-            "container_name": "tdtp-mssql",
-            "environment": {
-                "ACCEPT_EULA": "Y",
-                "SA_PASSWORD": "TdtpPassword123!",
-                "MSSQL_PID": "Developer"
-            },
-            "ports": ["1433:1433"],
-            "volumes": ["mssql-data:/var/opt/mssql"],
-            "networks": ["tdtp-network"],
-            "healthcheck": {
-                "test": [
-                    "CMD-SHELL",
-                    "/opt/mssql-tools/bin/sqlcmd -S localhost -U sa -P TdtpPassword123! -Q 'SELECT 1'"
-                ],
-                "interval": "10s",
-                "timeout": "5s",
-                "retries": 5
-            }
-        }
+        self.services["mssql"] = copy.deepcopy(_MSSQL_SERVICE)
         self.volumes["mssql-data"] = None
 
     def add_rabbitmq(self):
         """Добавить RabbitMQ"""
-        self.services["rabbitmq"] = {
-            "image": "rabbitmq:3.12-management-alpine",
-            "container_name": "tdtp-rabbitmq",
-            "environment": {
-                "RABBITMQ_DEFAULT_USER": "tdtp",
-                "RABBITMQ_DEFAULT_PASS": "tdtp_password"
-            },
-            "ports": [
-                "5672:5672",   # AMQP
-                "15672:15672"  # Management UI
-            ],
-            "volumes": ["rabbitmq-data:/var/lib/rabbitmq"],
-            "networks": ["tdtp-network"],
-            "healthcheck": {
-                "test": ["CMD", "rabbitmq-diagnostics", "-q", "ping"],
-                "interval": "10s",
-                "timeout": "5s",
-                "retries": 5
-            }
-        }
+        self.services["rabbitmq"] = copy.deepcopy(_RABBITMQ_SERVICE)
         self.volumes["rabbitmq-data"] = None
 
     def add_kafka(self):
         """Добавить Apache Kafka с Zookeeper"""
-        self.services["zookeeper"] = {
-            "image": "confluentinc/cp-zookeeper:7.5.0",
-            "container_name": "tdtp-zookeeper",
-            "environment": {
-                "ZOOKEEPER_CLIENT_PORT": 2181,
-                "ZOOKEEPER_TICK_TIME": 2000
-            },
-            "networks": ["tdtp-network"]
-        }
-
-        self.services["kafka"] = {
-            "image": "confluentinc/cp-kafka:7.5.0",
-            "container_name": "tdtp-kafka",
-            "depends_on": ["zookeeper"],
-            "environment": {
-                "KAFKA_BROKER_ID": 1,
-                "KAFKA_ZOOKEEPER_CONNECT": "zookeeper:2181",
-                "KAFKA_ADVERTISED_LISTENERS": "PLAINTEXT://localhost:9092",
-                "KAFKA_OFFSETS_TOPIC_REPLICATION_FACTOR": 1,
-                "KAFKA_TRANSACTION_STATE_LOG_MIN_ISR": 1,
-                "KAFKA_TRANSACTION_STATE_LOG_REPLICATION_FACTOR": 1
-            },
-            "ports": ["9092:9092"],
-            "networks": ["tdtp-network"],
-            "healthcheck": {
-                "test": ["CMD", "kafka-broker-api-versions", "--bootstrap-server", "localhost:9092"],
-                "interval": "10s",
-                "timeout": "10s",
-                "retries": 5
-            }
-        }
+        self.services["zookeeper"] = copy.deepcopy(_ZOOKEEPER_SERVICE)
+        self.services["kafka"] = copy.deepcopy(_KAFKA_SERVICE)
 
     def add_pgadmin(self):
         """Добавить pgAdmin (UI для PostgreSQL)"""
@@ -166,30 +240,11 @@ class DockerComposeGenerator:
             print("⚠️  Предупреждение: pgAdmin требует PostgreSQL. Добавляем PostgreSQL...")
             self.add_postgres()
 
-        self.services["pgadmin"] = {
-            "image": "dpage/pgadmin4:latest",
-            "container_name": "tdtp-pgadmin",
-            "environment": {
-                "PGADMIN_DEFAULT_EMAIL": "admin@tdtp.local",
-                "PGADMIN_DEFAULT_PASSWORD": "admin",
-                "PGADMIN_CONFIG_SERVER_MODE": "False"
-            },
-            "ports": ["5050:80"],
-            "networks": ["tdtp-network"],
-            "depends_on": ["postgres"]
-        }
+        self.services["pgadmin"] = copy.deepcopy(_PGADMIN_SERVICE)
 
     def add_adminer(self):
         """Добавить Adminer (универсальный UI для БД)"""
-        self.services["adminer"] = {
-            "image": "adminer:latest",
-            "container_name": "tdtp-adminer",
-            "ports": ["8080:8080"],
-            "networks": ["tdtp-network"],
-            "environment": {
-                "ADMINER_DEFAULT_SERVER": "postgres"
-            }
-        }
+        self.services["adminer"] = copy.deepcopy(_ADMINER_SERVICE)
 
     def add_kafka_ui(self):
         """Добавить Kafka UI"""
@@ -197,23 +252,11 @@ class DockerComposeGenerator:
             print("⚠️  Предупреждение: Kafka UI требует Kafka. Добавляем Kafka...")
             self.add_kafka()
 
-        self.services["kafka-ui"] = {
-            "image": "provectuslabs/kafka-ui:latest",
-            "container_name": "tdtp-kafka-ui",
-            "depends_on": ["kafka"],
-            "ports": ["8081:8080"],
-            "networks": ["tdtp-network"],
-            "environment": {
-                "KAFKA_CLUSTERS_0_NAME": "tdtp-kafka",
-                "KAFKA_CLUSTERS_0_BOOTSTRAPSERVERS": "kafka:9092",
-                "KAFKA_CLUSTERS_0_ZOOKEEPER": "zookeeper:2181"
-            }
-        }
+        self.services["kafka-ui"] = copy.deepcopy(_KAFKA_UI_SERVICE)
 
     def generate_compose(self) -> Dict[str, Any]:
         """Генерировать итоговый docker-compose.yml"""
         compose = {
-            "version": self.version,
             "services": self.services,
             "networks": self.networks
         }
@@ -225,10 +268,22 @@ class DockerComposeGenerator:
 
     def save_to_file(self, filename: str = "docker-compose.yml"):
         """Сохранить в файл"""
-        compose = self.generate_compose()
+        content = dump_compose(self.generate_compose()).encode("utf-8")
+
+        # Совпадающий файл не перезаписываем: mtime не меняется, и compose
+        # и файловые наблюдатели IDE не перечитывают его зря
+        try:
+            with open(filename, 'rb') as f:
+                unchanged = f.read() == content
+        except FileNotFoundError:
+            unchanged = False
+
+        if unchanged:
+            print(f"✅ Файл {filename} не изменился")
+            return filename
 
-        with open(filename, 'w') as f:
-            yaml.dump(compose, f, default_flow_style=False, sort_keys=False)
+        with open(filename, 'wb') as f:
+            f.write(content)
 
         print(f"✅ Файл {filename} успешно создан!")
         return filename
@@ -302,49 +357,60 @@ def interactive_mode():
 
 def print_summary(generator: DockerComposeGenerator):
     """Вывести сводку по созданной конфигурации"""
-    print()
-    print("=" * 60)
-    print("  Сводка конфигурации")
-    print("=" * 60)
-
-    print(f"\n📦 Сервисы ({len(generator.services)}):")
-    for service_name in generator.services.keys():
-        service = generator.services[service_name]
+    # Сводка собирается целиком и выводится одной записью
+    lines = [
+        "",
+        "=" * 60,
+        "  Сводка конфигурации",
+        "=" * 60,
+        f"\n📦 Сервисы ({len(generator.services)}):",
+    ]
+    for service_name, service in generator.services.items():
         ports = service.get("ports", [])
         if ports:
-            print(f"  ✓ {service_name:15} → {', '.join(ports)}")
+            lines.append(f"  ✓ {service_name:15} → {', '.join(ports)}")
         else:
-            print(f"  ✓ {service_name}")
+            lines.append(f"  ✓ {service_name}")
 
     if generator.volumes:
-        print(f"\n💾 Volumes ({len(generator.volumes)}):")
-        for volume_name in generator.volumes.keys():
-            print(f"  ✓ {volume_name}")
+        lines.append(f"\n💾 Volumes ({len(generator.volumes)}):")
+        for volume_name in generator.volumes:
+            lines.append(f"  ✓ {volume_name}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+# Текст не зависит от конфигурации - собран один раз
+USAGE_INSTRUCTIONS = "\n".join([
+    "",
+    "=" * 60,
+    "  Инструкции по запуску",
+    "=" * 60,
+    "",
+    "1️⃣  Запустить все сервисы:",
+    "    docker-compose up -d",
+    "",
+    "2️⃣  Проверить статус:",
+    "    docker-compose ps",
+    "",
+    "3️⃣  Посмотреть логи:",
+    "    docker-compose logs -f [service_name]",
+    "",
+    "4️⃣  Остановить все сервисы:",
+    "    docker-compose down",
+    "",
+    "5️⃣  Удалить все данные:",
+    "    docker-compose down -v",
+    "",
+    "=" * 60,
+]) + "\n"
 
 
 def print_usage_instructions():
     """Вывести инструкции по использованию"""
-    print()
-    print("=" * 60)
-    print("  Инструкции по запуску")
-    print("=" * 60)
-    print()
-    print("1️⃣  Запустить все сервисы:")
-    print("    docker-compose up -d")
-    print()
-    print("2️⃣  Проверить статус:")
-    print("    docker-compose ps")
-    print()
-    print("3️⃣  Посмотреть логи:")
-    print("    docker-compose logs -f [service_name]")
-    print()
-    print("4️⃣  Остановить все сервисы:")
-    print("    docker-compose down")
-    print()
-    print("5️⃣  Удалить все данные:")
-    print("    docker-compose down -v")
-    print()
-    print("=" * 60)
+    sys.stdout.write(USAGE_INSTRUCTIONS)
+    sys.stdout.flush()
 
 
 def main():
@@ -10,10 +10,16 @@
 import os
 import sqlite3
 
-import pandas as pd
+import pyarrow as pa
 
 from tdtp import TDTPClientJSON
 
+# Необязателен: без него экспорт идёт на фиксированном уровне DEFAULT_LEVEL
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 # ---------------------------------------------------------------------------
 # Конфигурация
 # ---------------------------------------------------------------------------
@@ -21,23 +27,86 @@ DB_PATH    = os.path.join(os.path.dirname(__file__), "..", "benchmark_100k.db")
 TABLE_NAME = "Users"
 OUTPUT_DIR = "/tmp/benchmark_export_py"
 
+# Подбор уровня zstd: пробуем уровни на образце размером с одну часть
+# (~3.8 MB, как режет J_export_all) и берём самый быстрый, чей коэффициент
+# сжатия не хуже лучшего более чем на LEVEL_TOLERANCE
+DEFAULT_LEVEL    = 3
+CANDIDATE_LEVELS = (1, 3, 9)
+LEVEL_TOLERANCE  = 0.03
+SAMPLE_BYTES     = 3_800_000
+# Если даже лучший уровень экономит меньше 2% - сжатие не окупается
+MIN_SAVING       = 0.02
+
+
+def _sample_part(rows):
+    """Собирает образец первой части: строки в виде "a|b|c" до SAMPLE_BYTES"""
+    chunks, size = [], 0
+    for row in rows:
+        line = "|".join(row).encode("utf-8")
+        chunks.append(line)
+        size += len(line) + 1
+        if size >= SAMPLE_BYTES:
+            break
+    return b"\n".join(chunks)
+
+
+def _pick_level(sample_bytes):
+    """Возвращает (level, compress) для образца.
+
+    level - минимальный из CANDIDATE_LEVELS, чей коэффициент сжатия в пределах
+    LEVEL_TOLERANCE от лучшего; compress=False, если данные почти не сжимаются.
+    """
+    if zstd is None or not sample_bytes:
+        return DEFAULT_LEVEL, True
+
+    raw = len(sample_bytes)
+    ratios = {
+        level: raw / len(zstd.ZstdCompressor(level=level).compress(sample_bytes))
+        for level in CANDIDATE_LEVELS
+    }
+    best = max(ratios.values())
+    if best < 1 / (1 - MIN_SAVING):
+        return DEFAULT_LEVEL, False
+
+    level = min(l for l, r in ratios.items() if r >= best * (1 - LEVEL_TOLERANCE))
+    return level, True
+
 
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     client = TDTPClientJSON()
-    conn   = sqlite3.connect(DB_PATH)
+    # Только чтение: mode=ro не создаёт журнал и не трогает файл БД.
+    # journal_mode/synchronous на чтение не влияют - настраиваем только
+    # кэш: страницы отображаются через mmap (без копирования в буфер
+    # SQLite), cache_size держит весь полный скан в памяти
+    conn   = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    conn.execute("PRAGMA mmap_size = 1073741824")  # 1 GiB
+    conn.execute("PRAGMA cache_size = -131072")    # 128 MiB
 
     print(f"Читаем таблицу {TABLE_NAME}…")
-    df = pd.read_sql_query(f"SELECT * FROM {TABLE_NAME}", conn)
+    cursor = conn.execute(f"SELECT * FROM {TABLE_NAME}")
+    names  = [d[0] for d in cursor.description]
+    rows   = cursor.fetchall()
     conn.close()
-    print(f"Загружено строк: {len(df):,}")
+    print(f"Загружено строк: {len(rows):,}")
 
-    # Библиотека строит schema/header из DataFrame автоматически
-    data = client.J_from_pandas(df, table_name=TABLE_NAME)
+    # SQLite -> Arrow без pandas: zip(*rows) транспонирует строки в колонки
+    # на C-уровне, pa.array строит типизированный буфер колонки за один
+    # проход. Дальше числовые колонки сериализуются в строки через numpy
+    # целиком, а не по ячейке
+    columns = zip(*rows) if rows else [()] * len(names)
+    table = pa.table([pa.array(col) for col in columns], names=names)
+    del rows, columns
+    data = client.J_from_arrow(table, table_name=TABLE_NAME)
 
     # Один вызов — фреймворк сам партиционирует, жмёт, добавляет контрольные суммы
     base = os.path.join(OUTPUT_DIR, f"{TABLE_NAME}.tdtp.xml")
-    result = client.J_export_all(data, base, compress=True, checksum=True, level=3)
+    level, compress = _pick_level(_sample_part(data["data"]))
+    if compress:
+        print(f"Уровень zstd: {level}")
+    else:
+        print("Данные почти не сжимаются — пишем без сжатия")
+    result = client.J_export_all(data, base, compress=compress, checksum=True, level=level)
 
     print(f"\nИтого файлов: {result['total_parts']}")
     total_size = 0
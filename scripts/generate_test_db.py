@@ -13,14 +13,17 @@
 Это обеспечивает корректное сохранение схемы в TDTP XML и импорт в другие СУБД.
 """
 
+import os
 import sqlite3
 import random
 import string
-from datetime import datetime, timedelta
+from datetime import date
+from multiprocessing import Pool
 
 # Конфигурация
 DB_FILE = "test_data.db"
 NUM_RECORDS = 100000
+CHUNK_SIZE = 10000  # записей на одну задачу воркера
 
 # Данные для генерации - расширенные списки
 MALE_NAMES = [
@@ -82,22 +85,43 @@ INSURANCE_REGIONS = [
     "66", "74", "02", "24", "34", "36", "38", "42", "55", "59"
 ]
 
+TRANSLIT_TABLE = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
+    'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
+    'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
+    'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
+    'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya'
+})
+
+# Имена и фамилии - конечные списки, транслитерируем их один раз
+TRANSLIT_NAMES = {
+    name: name.lower().translate(TRANSLIT_TABLE)
+    for name in MALE_NAMES + FEMALE_NAMES + MALE_LAST_NAMES + FEMALE_LAST_NAMES
+}
+
+PHONE_OPERATORS = (900, 901, 902, 903, 904, 905, 906, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 936, 937, 938, 939, 950, 951, 952, 953, 958, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 977, 978, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 991, 992, 993, 994, 995, 996, 997, 999)
+
+DESCRIPTION_WORDS = (
+    "разработчик", "менеджер", "аналитик", "дизайнер", "тестировщик",
+    "архитектор", "консультант", "инженер", "специалист", "эксперт",
+    "администратор", "координатор", "руководитель", "директор", "бухгалтер",
+    "юрист", "маркетолог", "логист", "экономист", "переводчик"
+)
+DESCRIPTION_LEVELS = ("junior", "middle", "senior", "lead", "principal", "chief", "head")
+DESCRIPTION_DEPARTMENTS = (
+    "IT", "HR", "Sales", "Marketing", "Finance", "Operations",
+    "Legal", "Support", "R&D", "QA", "Security", "Analytics"
+)
+
+def transliterate_text(text):
+    """Транслитерирует кириллицу в латиницу (нижний регистр)"""
+    result = TRANSLIT_NAMES.get(text)
+    if result is None:
+        result = text.lower().translate(TRANSLIT_TABLE)
+    return result
+
 def generate_email(first_name, last_name, idx):
     """Генерирует email на основе имени"""
-    transliterate = {
-        'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e',
-        'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm',
-        'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u',
-        'ф': 'f', 'х': 'h', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch',
-        'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya'
-    }
-
-    def transliterate_text(text):
-        result = ""
-        for char in text.lower():
-            result += transliterate.get(char, char)
-        return result
-
     name = transliterate_text(first_name)
     surname = transliterate_text(last_name)
     domain = random.choice(DOMAINS)
@@ -117,28 +141,32 @@ def generate_email(first_name, last_name, idx):
 
 def generate_phone():
     """Генерирует случайный номер телефона"""
-    operators = [900, 901, 902, 903, 904, 905, 906, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 936, 937, 938, 939, 950, 951, 952, 953, 958, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 977, 978, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 991, 992, 993, 994, 995, 996, 997, 999]
-    return f"+7{random.choice(operators)}{random.randint(1000000, 9999999)}"
+    return f"+7{random.choice(PHONE_OPERATORS)}{random.randint(1000000, 9999999)}"
+
+_YEAR_ORDINALS = {}
+_TODAY_ORDINAL = date.today().toordinal()
+
+def _year_ordinals(start_year, end_year):
+    """Границы [1 янв start_year, 31 дек end_year] в виде порядковых номеров дней"""
+    bounds = _YEAR_ORDINALS.get((start_year, end_year))
+    if bounds is None:
+        bounds = (date(start_year, 1, 1).toordinal(), date(end_year, 12, 31).toordinal())
+        _YEAR_ORDINALS[(start_year, end_year)] = bounds
+    return bounds
 
 def generate_date(start_year=2020, end_year=2024):
     """Генерирует случайную дату"""
-    start = datetime(start_year, 1, 1)
-    end = datetime(end_year, 12, 31)
-    delta = end - start
-    random_days = random.randint(0, delta.days)
-    return (start + timedelta(days=random_days)).strftime("%Y-%m-%d %H:%M:%S")
+    # Целочисленная арифметика над номером дня вместо datetime + timedelta
+    start, end = _year_ordinals(start_year, end_year)
+    return date.fromordinal(random.randint(start, end)).isoformat() + " 00:00:00"
 
 def generate_birth_date():
     """Генерирует дату рождения (возраст от 18 до 80 лет)"""
-    today = datetime.now()
     min_age = 18
     max_age = 80
 
-    days_in_range = (max_age - min_age) * 365
     random_days = random.randint(min_age * 365, max_age * 365)
-    birth_date = today - timedelta(days=random_days)
-
-    return birth_date.strftime("%Y-%m-%d")
+    return date.fromordinal(_TODAY_ORDINAL - random_days).isoformat()
 
 def generate_inn():
     """Генерирует случайный ИНН (12 цифр для физ. лица)"""
@@ -161,26 +189,59 @@ def generate_insurance_policy():
 
 def generate_description():
     """Генерирует случайное описание"""
-    words = [
-        "разработчик", "менеджер", "аналитик", "дизайнер", "тестировщик",
-        "архитектор", "консультант", "инженер", "специалист", "эксперт",
-        "администратор", "координатор", "руководитель", "директор", "бухгалтер",
-        "юрист", "маркетолог", "логист", "экономист", "переводчик"
-    ]
-    levels = ["junior", "middle", "senior", "lead", "principal", "chief", "head"]
-    departments = [
-        "IT", "HR", "Sales", "Marketing", "Finance", "Operations",
-        "Legal", "Support", "R&D", "QA", "Security", "Analytics"
+    return (f"{random.choice(DESCRIPTION_LEVELS)} {random.choice(DESCRIPTION_WORDS)}, "
+            f"отдел {random.choice(DESCRIPTION_DEPARTMENTS)}")
+
+def gen_chunk(args):
+    """Генерирует записи с id в диапазоне [start, end) в процессе-воркере.
+
+    Данные возвращаются по колонкам (16 параллельных списков): построчные
+    кортежи собирает уже zip() в главном процессе при вставке.
+
+    Каждый чанк получает собственный seed: после fork воркеры наследуют
+    одинаковое состояние ГПСЧ родителя и без пересева выдавали бы
+    одинаковые данные.
+    """
+    start, end, seed = args
+    random.seed(seed)
+    choice = random.choice
+
+    ids = list(range(start, end))
+
+    # Пол определяет имя, фамилию и семейное положение
+    genders = [choice(("М", "Ж")) for _ in ids]
+    male = [g == "М" for g in genders]
+    first_names = [choice(MALE_NAMES) if m else choice(FEMALE_NAMES) for m in male]
+    last_names = [choice(MALE_LAST_NAMES) if m else choice(FEMALE_LAST_NAMES) for m in male]
+    marital_statuses = [
+        choice(("холост", "женат", "разведён", "вдовец")) if m
+        else choice(("не замужем", "замужем", "разведена", "вдова"))
+        for m in male
     ]
 
-    return f"{random.choice(levels)} {random.choice(words)}, отдел {random.choice(departments)}"
+    birth_dates = [generate_birth_date() for _ in ids]
+    emails = [generate_email(f, l, i) for f, l, i in zip(first_names, last_names, ids)]
+    phones = [generate_phone() for _ in ids]
+    inns = [generate_inn() for _ in ids]
+    insurance_policies = [generate_insurance_policy() for _ in ids]
+    cities = [choice(CITIES) for _ in ids]
+    statuses = [choice(STATUSES) for _ in ids]
+    balances = [round(random.uniform(0, 500000), 2) for _ in ids]
+    created_ats = [generate_date(2018, 2023) for _ in ids]
+    updated_ats = [generate_date(2023, 2024) for _ in ids]
+    descriptions = [generate_description() for _ in ids]
+
+    return (
+        ids, first_names, last_names, genders, birth_dates, emails, phones,
+        inns, insurance_policies, cities, marital_statuses, statuses, balances,
+        created_ats, updated_ats, descriptions
+    )
 
 def main():
     print(f"Создание базы данных: {DB_FILE}")
     print(f"Количество записей: {NUM_RECORDS}")
 
     # Удаляем старую базу если есть
-    import os
     if os.path.exists(DB_FILE):
         os.remove(DB_FILE)
 
@@ -204,7 +265,8 @@ def main():
             birth_date DATE NOT NULL,
 
             -- Email (VARCHAR(255) - стандарт RFC 5321)
-            email VARCHAR(255) NOT NULL UNIQUE,
+            -- Уникальность обеспечивает idx_users_email, создаваемый после загрузки
+            email VARCHAR(255) NOT NULL,
 
             -- Телефон (VARCHAR(20) - международный формат до 20 символов)
             phone VARCHAR(20),
@@ -236,60 +298,39 @@ def main():
         )
     """)
 
-    # Создаем индексы
-    cursor.execute("CREATE INDEX idx_users_email ON users(email)")
+    print(f"Генерация данных ({os.cpu_count()} процессов)...")
+
+    # Генерация параллельна по чанкам; запись в SQLite остаётся
+    # в главном процессе - единственном владельце соединения
+    base_seed = random.randrange(1 << 32)
+    chunks = [
+        (start, min(start + CHUNK_SIZE, NUM_RECORDS + 1), base_seed + n)
+        for n, start in enumerate(range(1, NUM_RECORDS + 1, CHUNK_SIZE))
+    ]
+
+    generated = 0
+    with Pool(os.cpu_count()) as pool:
+        for columns in pool.imap_unordered(gen_chunk, chunks):
+            cursor.executemany("""
+                INSERT INTO users (id, first_name, last_name, gender, birth_date, email, phone,
+                                  inn, insurance_policy, city, marital_status, status, balance,
+                                  created_at, updated_at, description)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, zip(*columns))
+            generated += len(columns[0])
+            print(f"  Сгенерировано {generated} записей...")
+
+    conn.commit()
+
+    # Индексы строим после загрузки: одна сортировка по готовой таблице
+    # вместо поддержки шести B-деревьев на каждой вставке
+    print("Создание индексов...")
+    cursor.execute("CREATE UNIQUE INDEX idx_users_email ON users(email)")
     cursor.execute("CREATE INDEX idx_users_status ON users(status)")
     cursor.execute("CREATE INDEX idx_users_city ON users(city)")
     cursor.execute("CREATE INDEX idx_users_inn ON users(inn)")
     cursor.execute("CREATE INDEX idx_users_gender ON users(gender)")
     cursor.execute("CREATE INDEX idx_users_marital ON users(marital_status)")
-
-    print("Генерация данных...")
-
-    # Генерируем данные
-    records = []
-    for i in range(1, NUM_RECORDS + 1):
-        # Определяем пол
-        gender = random.choice(["М", "Ж"])
-
-        if gender == "М":
-            first_name = random.choice(MALE_NAMES)
-            last_name = random.choice(MALE_LAST_NAMES)
-            marital_status = random.choice(["холост", "женат", "разведён", "вдовец"])
-        else:
-            first_name = random.choice(FEMALE_NAMES)
-            last_name = random.choice(FEMALE_LAST_NAMES)
-            marital_status = random.choice(["не замужем", "замужем", "разведена", "вдова"])
-
-        birth_date = generate_birth_date()
-        email = generate_email(first_name, last_name, i)
-        phone = generate_phone()
-        inn = generate_inn()
-        insurance_policy = generate_insurance_policy()
-        city = random.choice(CITIES)
-        status = random.choice(STATUSES)
-        balance = round(random.uniform(0, 500000), 2)
-        created_at = generate_date(2018, 2023)
-        updated_at = generate_date(2023, 2024)
-        description = generate_description()
-
-        records.append((
-            i, first_name, last_name, gender, birth_date, email, phone,
-            inn, insurance_policy, city, marital_status, status, balance,
-            created_at, updated_at, description
-        ))
-
-        if i % 10000 == 0:
-            print(f"  Сгенерировано {i} записей...")
-
-    # Вставляем данные
-    cursor.executemany("""
-        INSERT INTO users (id, first_name, last_name, gender, birth_date, email, phone,
-                          inn, insurance_policy, city, marital_status, status, balance,
-                          created_at, updated_at, description)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, records)
-
     conn.commit()
 
     # Проверяем результат
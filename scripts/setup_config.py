@@ -18,31 +18,9 @@ import argparse
 from pathlib import Path
 from typing import Dict, Any
 
-
-class ConfigSetup:
-    def __init__(self, project_root: Path, force: bool = False):
-        self.project_root = project_root
-        self.force = force
-        self.created_count = 0
-
-    def write_file(self, path: Path, content: str, description: str):
-        """Write file if it doesn't exist or force=True"""
-        if path.exists() and not self.force:
-            print(f"⊘ Skipping {path.relative_to(self.project_root)} (already exists, use --force to overwrite)")
-            return False
-
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
-        print(f"✓ Created {path.relative_to(self.project_root)} - {description}")
-        self.created_count += 1
-        return True
-
-    def setup_wails_config(self):
-        """Ensure wails.json is correct"""
-        print("\n=== Setting up Wails Configuration ===")
-
-        wails_config = self.project_root / 'cmd' / 'tdtp-xray' / 'wails.json'
-        content = '''{
+# File contents are kept as UTF-8 bytes and written as-is: no per-call
+# encoding and no newline translation, so output is identical on every OS
+_WAILS_JSON = b'''{
   "name": "tdtp-xray",
   "outputfilename": "tdtp-xray",
   "frontend:install": "",
@@ -55,14 +33,8 @@ class ConfigSetup:
   "debounceMS": 100
 }
 '''
-        self.write_file(wails_config, content, "Wails application config")
 
-    def setup_docker_compose(self):
-        """Ensure main docker-compose.yml exists"""
-        print("\n=== Setting up Docker Compose ===")
-
-        docker_compose = self.project_root / 'docker-compose.yml'
-        content = '''version: '3.8'
+_DOCKER_COMPOSE_YML = b'''version: '3.8'
 
 services:
   # ============================================
@@ -180,15 +152,8 @@ volumes:
   mysql-data:
     name: tdtp-mysql-data
 '''
-        self.write_file(docker_compose, content, "Docker Compose unified environment")
 
-    def setup_gitignore_additions(self):
-        """Add important gitignore patterns"""
-        print("\n=== Updating .gitignore ===")
-
-        gitignore = self.project_root / '.gitignore'
-
-        additional_patterns = '''
+_GITIGNORE_PATTERNS = b'''
 # TDTP X-Ray specific
 cmd/tdtp-xray/frontend/dist/
 cmd/tdtp-xray/build/
@@ -223,24 +188,7 @@ __pycache__/
 docker-compose.override.yml
 '''
 
-        if gitignore.exists():
-            content = gitignore.read_text()
-            if '# TDTP X-Ray specific' not in content:
-                with gitignore.open('a') as f:
-                    f.write(additional_patterns)
-                print(f"✓ Updated {gitignore.relative_to(self.project_root)} with additional patterns")
-                self.created_count += 1
-            else:
-                print(f"⊘ .gitignore already contains TDTP patterns")
-        else:
-            self.write_file(gitignore, additional_patterns, "Git ignore patterns")
-
-    def setup_env_template(self):
-        """Create .env.template for environment variables"""
-        print("\n=== Setting up Environment Template ===")
-
-        env_template = self.project_root / '.env.template'
-        content = '''# TDTP Framework Environment Variables Template
+_ENV_TEMPLATE = b'''# TDTP Framework Environment Variables Template
 # Copy this file to .env and fill in your values
 
 # ===== Database Credentials =====
@@ -280,7 +228,94 @@ LOG_LEVEL=info
 # Development mode
 DEV_MODE=true
 '''
-        self.write_file(env_template, content, "Environment variables template")
+
+
+class ConfigSetup:
+    def __init__(self, project_root: Path, force: bool = False):
+        self.project_root = project_root
+        self.force = force
+        self.created_count = 0
+        # Relative paths for messages are a string slice, not Path.relative_to
+        self._root_prefix = str(project_root) + os.sep
+
+    def write_file(self, path: Path, content: bytes, description: str):
+        """Write file if it doesn't exist or force=True.
+
+        Content goes to a sibling temp file first and is then moved into
+        place, so an interrupted run never leaves a half-written config.
+        Without --force the move is os.link, which fails if the target
+        exists - the existence check and the publish are one atomic step.
+        """
+        rel_path = str(path).removeprefix(self._root_prefix)
+        skip_msg = f"⊘ Skipping {rel_path} (already exists, use --force to overwrite)"
+        # Cheap early exit for the common re-run case; os.link below still
+        # guards against the file appearing in between
+        if not self.force and path.exists():
+            print(skip_msg)
+            return False
+
+        tmp = path.with_name(path.name + '.tmp')
+
+        try:
+            tmp.write_bytes(content)
+        except FileNotFoundError:
+            # Parent directory is created only when it is actually missing
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(content)
+
+        try:
+            if self.force:
+                os.replace(tmp, path)
+            else:
+                os.link(tmp, path)
+                tmp.unlink()
+        except FileExistsError:
+            tmp.unlink()
+            print(skip_msg)
+            return False
+
+        print(f"✓ Created {rel_path} - {description}")
+        self.created_count += 1
+        return True
+
+    def setup_wails_config(self):
+        """Ensure wails.json is correct"""
+        print("\n=== Setting up Wails Configuration ===")
+
+        wails_config = self.project_root / 'cmd' / 'tdtp-xray' / 'wails.json'
+        self.write_file(wails_config, _WAILS_JSON, "Wails application config")
+
+    def setup_docker_compose(self):
+        """Ensure main docker-compose.yml exists"""
+        print("\n=== Setting up Docker Compose ===")
+
+        docker_compose = self.project_root / 'docker-compose.yml'
+        self.write_file(docker_compose, _DOCKER_COMPOSE_YML, "Docker Compose unified environment")
+
+    def setup_gitignore_additions(self):
+        """Add important gitignore patterns"""
+        print("\n=== Updating .gitignore ===")
+
+        gitignore = self.project_root / '.gitignore'
+
+        if gitignore.exists():
+            content = gitignore.read_bytes()
+            if b'# TDTP X-Ray specific' not in content:
+                with gitignore.open('ab') as f:
+                    f.write(_GITIGNORE_PATTERNS)
+                print(f"✓ Updated {gitignore.relative_to(self.project_root)} with additional patterns")
+                self.created_count += 1
+            else:
+                print(f"⊘ .gitignore already contains TDTP patterns")
+        else:
+            self.write_file(gitignore, _GITIGNORE_PATTERNS, "Git ignore patterns")
+
+    def setup_env_template(self):
+        """Create .env.template for environment variables"""
+        print("\n=== Setting up Environment Template ===")
+
+        env_template = self.project_root / '.env.template'
+        self.write_file(env_template, _ENV_TEMPLATE, "Environment variables template")
 
     def run(self):
         """Run all setup tasks"""
@@ -3,9 +3,46 @@
 Генерация конфигурационных файлов для тестирования
 """
 
+import copy
 import yaml
 from pathlib import Path
 
+# C-эмиттер libyaml, если PyYAML собран с ним; иначе чисто питоновский
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+# Базовая конфигурация - строится один раз при импорте
+_BASE_CONFIG = {
+    'export': {
+        'compress': False,
+        'compress_level': 3
+    },
+    'resilience': {
+        'circuit_breaker': {
+            'enabled': True,
+            'threshold': 5,
+            'timeout': 60,
+            'max_concurrent': 100,
+            'success_threshold': 2
+        },
+        'retry': {
+            'enabled': True,
+            'max_attempts': 3,
+            'strategy': 'exponential',
+            'initial_wait_ms': 1000,
+            'max_wait_ms': 30000,
+            'jitter': True
+        }
+    },
+    'audit': {
+        'enabled': True,
+        'level': 'standard',
+        'max_size_mb': 100
+    }
+}
+
 
 class ConfigGenerator:
     def __init__(self, output_dir=None):
@@ -16,34 +53,8 @@ class ConfigGenerator:
 
     def base_config(self):
         """Базовая конфигурация (общая для всех)"""
-        return {
-            'export': {
-                'compress': False,
-                'compress_level': 3
-            },
-            'resilience': {
-                'circuit_breaker': {
-                    'enabled': True,
-                    'threshold': 5,
-                    'timeout': 60,
-                    'max_concurrent': 100,
-                    'success_threshold': 2
-                },
-                'retry': {
-                    'enabled': True,
-                    'max_attempts': 3,
-                    'strategy': 'exponential',
-                    'initial_wait_ms': 1000,
-                    'max_wait_ms': 30000,
-                    'jitter': True
-                }
-            },
-            'audit': {
-                'enabled': True,
-                'level': 'standard',
-                'max_size_mb': 100
-            }
-        }
+        # Копия шаблона: generate_* дописывают вложенные секции (audit, export)
+        return copy.deepcopy(_BASE_CONFIG)
 
     def generate_postgres_config(self, database='tdtp_test'):
         """PostgreSQL конфигурация"""
@@ -119,7 +130,7 @@ class ConfigGenerator:
         filepath = self.output_dir / filename
 
         with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         print(f"✓ {filename}")
 
@@ -6,6 +6,12 @@
 import yaml
 from pathlib import Path
 
+# C-эмиттер libyaml, если PyYAML собран с ним; иначе чисто питоновский
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 
 def generate_docker_compose():
     """Создает docker-compose.yml с PostgreSQL, RabbitMQ и Kafka"""
@@ -16,6 +22,8 @@ def generate_docker_compose():
             'postgres': {
                 'image': 'postgres:15-alpine',
                 'container_name': 'tdtp_postgres',
+                # Тестовая БД одноразовая: коммит не ждёт сброса WAL на диск
+                'command': ['postgres', '-c', 'synchronous_commit=off'],
                 'environment': {
                     'POSTGRES_USER': 'postgres',
                     'POSTGRES_PASSWORD': 'postgres',
@@ -84,7 +92,7 @@ def generate_docker_compose():
     output_path = Path(__file__).parent.parent.parent / 'docker-compose.yml'
 
     with open(output_path, 'w', encoding='utf-8') as f:
-        yaml.dump(compose, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(compose, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
     print(f"✓ docker-compose.yml создан: {output_path}")
     print("\nЗапуск:")
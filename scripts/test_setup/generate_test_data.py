@@ -4,10 +4,28 @@
 """
 
 import psycopg2
-import random
-from datetime import datetime, timedelta
+import csv
+import io
+import sys
+from datetime import datetime
 from faker import Faker
 
+from init_postgres import USERS_COLUMNS
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: pip install numpy")
+    sys.exit(1)
+
+# Пачка грузится через COPY: CSV-поток вместо SQL-текста с литералами,
+# сервер не разбирает и не планирует INSERT
+COPY_USERS_SQL = f"COPY users ({', '.join(USERS_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
+# Размер пулов значений Faker: у ru_RU всего несколько сотен имён, фамилий
+# и профессий, так что пул такого размера покрывает их с запасом
+FAKER_POOL_SIZE = 2000
+
 
 class TestDataGenerator:
     def __init__(self, host='localhost', port=5432, user='tdtp_user', password='tdtp_pass', database='tdtp_test'):
@@ -17,6 +35,10 @@ class TestDataGenerator:
         self.password = password
         self.database = database
         self.fake = Faker('ru_RU')
+        # Generator (PCG64) - колонки случайных чисел одним вызовом на колонку
+        self.rng = np.random.default_rng()
+        # Максимальный id в users - известен после generate_batch
+        self._max_id = None
 
         # Справочники
         self.cities = [
@@ -30,6 +52,25 @@ class TestDataGenerator:
         self.marital_statuses_male = ['холост', 'женат', 'разведён', 'вдовец']
         self.marital_statuses_female = ['не замужем', 'замужем', 'разведена', 'вдова']
 
+        self.email_domains = ['mail.ru', 'yandex.ru', 'gmail.com']
+        self.seniorities = ['junior', 'middle', 'senior', 'lead', 'principal', 'head', 'chief']
+        self.departments = ['IT', 'HR', 'Finance', 'Sales', 'Marketing']
+
+        # Пулы значений Faker строятся один раз: дальше колонки выбираются
+        # из них одним np.random.choice, без вызова провайдера на каждую строку
+        fake = self.fake
+        self._pool_first_m = self._faker_pool(fake.first_name_male)
+        self._pool_last_m = self._faker_pool(fake.last_name_male)
+        self._pool_first_f = self._faker_pool(fake.first_name_female)
+        self._pool_last_f = self._faker_pool(fake.last_name_female)
+        self._pool_user_name = self._faker_pool(fake.user_name)
+        self._pool_job = self._faker_pool(fake.job)
+
+    @staticmethod
+    def _faker_pool(provider, size=FAKER_POOL_SIZE):
+        """Массив из size значений провайдера Faker"""
+        return np.array([provider() for _ in range(size)], dtype=object)
+
     def connect(self):
         """Подключение к БД"""
         return psycopg2.connect(
@@ -40,39 +81,85 @@ class TestDataGenerator:
             database=self.database
         )
 
+    def _make_columns(self, start_id, n):
+        """Генерация n пользователей по колонкам (id с start_id).
+
+        Справочные, числовые колонки и даты - один вызов NumPy на колонку
+        вместо вызова random на каждую строку; имена, логины и профессии
+        выбираются из пулов Faker (мужские и женские - по своим индексам).
+        Возвращает dict колонка -> список значений в порядке колонок users.
+        """
+        rng = self.rng
+        ids = np.arange(start_id, start_id + n)
+
+        genders = rng.choice(['М', 'Ж'], n)
+        male_idx = np.flatnonzero(genders == 'М')
+        female_idx = np.flatnonzero(genders == 'Ж')
+
+        first_names = np.empty(n, dtype=object)
+        last_names = np.empty(n, dtype=object)
+        marital_statuses = np.empty(n, dtype=object)
+        first_names[male_idx] = rng.choice(self._pool_first_m, len(male_idx))
+        last_names[male_idx] = rng.choice(self._pool_last_m, len(male_idx))
+        marital_statuses[male_idx] = rng.choice(self.marital_statuses_male, len(male_idx))
+        first_names[female_idx] = rng.choice(self._pool_first_f, len(female_idx))
+        last_names[female_idx] = rng.choice(self._pool_last_f, len(female_idx))
+        marital_statuses[female_idx] = rng.choice(self.marital_statuses_female, len(female_idx))
+
+        # Возраст 18-80 лет: даты - одна операция над datetime64,
+        # tolist() отдаёт datetime.date / datetime.datetime
+        today = np.datetime64(datetime.now().date(), 'D')
+        birth_dates = (today - rng.integers(18 * 365, 81 * 365, n).astype('timedelta64[D]')).tolist()
+
+        domains = rng.choice(self.email_domains, n)
+        user_names = rng.choice(self._pool_user_name, n)
+        emails = [f"{user_name}{user_id}@{domain}"
+                  for user_name, user_id, domain in zip(user_names.tolist(), ids.tolist(), domains.tolist())]
+
+        phones = np.char.add('+7', rng.integers(9000000000, 10000000000, n, dtype=np.int64).astype(str))
+        inns = rng.integers(100000000000, 1000000000000, n, dtype=np.int64).astype(str)
+        insurance_policies = np.char.add(
+            np.char.add(rng.integers(1000, 10000, n).astype(str), ' '),
+            rng.integers(100000, 1000000, n).astype(str)
+        )
+
+        cities = rng.choice(self.cities, n)
+        statuses = rng.choice(self.statuses, n)
+        balances = np.round(rng.uniform(10000, 500000, n), 2)
+
+        now = np.datetime64(datetime.now(), 'us')
+        created_at = now - rng.integers(1, 365 * 5 + 1, n).astype('timedelta64[D]')
+        updated_at = created_at + rng.integers(0, 365 * 2 + 1, n).astype('timedelta64[D]')
+
+        seniorities = rng.choice(self.seniorities, n)
+        departments = rng.choice(self.departments, n)
+        jobs = rng.choice(self._pool_job, n)
+        descriptions = [f"{seniority} {job}, отдел {department}"
+                        for seniority, job, department in zip(seniorities.tolist(), jobs.tolist(), departments.tolist())]
+
+        # tolist() - psycopg2 адаптирует только встроенные типы Python
+        return {
+            'id': ids.tolist(),
+            'first_name': first_names.tolist(),
+            'last_name': last_names.tolist(),
+            'gender': genders.tolist(),
+            'birth_date': birth_dates,
+            'email': emails,
+            'phone': phones.tolist(),
+            'inn': inns.tolist(),
+            'insurance_policy': insurance_policies.tolist(),
+            'city': cities.tolist(),
+            'marital_status': marital_statuses.tolist(),
+            'status': statuses.tolist(),
+            'balance': balances.tolist(),
+            'created_at': created_at.tolist(),
+            'updated_at': updated_at.tolist(),
+            'description': descriptions,
+        }
+
     def generate_user(self, user_id):
         """Генерация одного пользователя"""
-        gender = random.choice(['М', 'Ж'])
-
-        if gender == 'М':
-            first_name = self.fake.first_name_male()
-            last_name = self.fake.last_name_male()
-            marital_status = random.choice(self.marital_statuses_male)
-        else:
-            first_name = self.fake.first_name_female()
-            last_name = self.fake.last_name_female()
-            marital_status = random.choice(self.marital_statuses_female)
-
-        birth_date = self.fake.date_of_birth(minimum_age=18, maximum_age=80)
-        email = f"{self.fake.user_name()}{user_id}@{random.choice(['mail.ru', 'yandex.ru', 'gmail.com'])}"
-        phone = f"+7{random.randint(9000000000, 9999999999)}"
-        inn = f"{random.randint(100000000000, 999999999999)}"
-        insurance_policy = f"{random.randint(1000, 9999)} {random.randint(100000, 999999)}"
-        city = random.choice(self.cities)
-        status = random.choice(self.statuses)
-        balance = round(random.uniform(10000, 500000), 2)
-
-        created_at = datetime.now() - timedelta(days=random.randint(1, 365 * 5))
-        updated_at = created_at + timedelta(days=random.randint(0, 365 * 2))
-
-        description = f"{random.choice(['junior', 'middle', 'senior', 'lead', 'principal', 'head', 'chief'])} " \
-                      f"{self.fake.job()}, отдел {random.choice(['IT', 'HR', 'Finance', 'Sales', 'Marketing'])}"
-
-        return (
-            user_id, first_name, last_name, gender, birth_date,
-            email, phone, inn, insurance_policy, city,
-            marital_status, status, balance, created_at, updated_at, description
-        )
+        return next(zip(*self._make_columns(user_id, 1).values()))
 
     def generate_batch(self, count=10000, batch_size=1000):
         """Генерация и вставка пакета пользователей"""
@@ -81,6 +168,10 @@ class TestDataGenerator:
         conn = self.connect()
         cursor = conn.cursor()
 
+        # Вся загрузка - одна транзакция; коммит не ждёт сброса WAL на диск.
+        # SET LOCAL действует до конца транзакции, сбрасывать не нужно
+        cursor.execute("SET LOCAL synchronous_commit = off;")
+
         # Очистка таблицы
         cursor.execute("TRUNCATE TABLE users;")
         print("  ✓ Таблица очищена")
@@ -89,23 +180,22 @@ class TestDataGenerator:
 
         for batch_start in range(1, count + 1, batch_size):
             batch_end = min(batch_start + batch_size, count + 1)
-            batch_data = [self.generate_user(i) for i in range(batch_start, batch_end)]
-
-            # Bulk insert
-            insert_query = """
-                INSERT INTO users (
-                    id, first_name, last_name, gender, birth_date,
-                    email, phone, inn, insurance_policy, city,
-                    marital_status, status, balance, created_at, updated_at, description
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
+            columns = self._make_columns(batch_start, batch_end - batch_start)
 
-            cursor.executemany(insert_query, batch_data)
-            conn.commit()
+            # Строки упаковываются в CSV на C-уровне (csv.writer берёт кортежи
+            # прямо из zip), список кортежей не материализуется. Колонки
+            # берутся в порядке USERS_COLUMNS - как в COPY_USERS_SQL
+            buf = io.StringIO()
+            csv.writer(buf).writerows(zip(*(columns[name] for name in USERS_COLUMNS)))
+            buf.seek(0)
+            cursor.copy_expert(COPY_USERS_SQL, buf)
 
-            total_inserted += len(batch_data)
+            total_inserted += batch_end - batch_start
             print(f"  → {total_inserted}/{count} записей", end='\r')
 
+        # Один коммит на всю загрузку
+        conn.commit()
+        self._max_id = count
         print(f"\n  ✓ Вставлено {total_inserted} записей")
 
         # Статистика
@@ -124,12 +214,19 @@ class TestDataGenerator:
         conn = self.connect()
         cursor = conn.cursor()
 
-        cursor.execute(f"""
+        # id идут подряд с 1, поэтому случайные строки - это случайные id:
+        # выборка по первичному ключу вместо ORDER BY RANDOM() по всей таблице
+        max_id = self._max_id
+        if max_id is None:
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM users;")
+            max_id = cursor.fetchone()[0]
+        ids = (self.rng.choice(max_id, size=min(limit, max_id), replace=False) + 1).tolist()
+
+        cursor.execute("""
             SELECT id, first_name, last_name, gender, city, status, balance
             FROM users
-            ORDER BY RANDOM()
-            LIMIT {limit};
-        """)
+            WHERE id = ANY(%s);
+        """, (ids,))
 
         rows = cursor.fetchall()
 
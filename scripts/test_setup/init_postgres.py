@@ -5,37 +5,153 @@
 """
 
 import psycopg2
+from psycopg2 import sql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+import hashlib
+import random
+import socket
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Ожидание PostgreSQL: пока порт закрыт - дешёвая TCP-проверка каждые
+# 0.1 с, полное подключение - только к открытому порту. Если порт открыт,
+# но сервер ещё стартует, пауза растёт 0.2 -> 0.4 -> ... -> 2 с плюс
+# небольшой разброс. Общий лимит покрывает холодный старт контейнера
+WAIT_TIMEOUT = 60.0
+WAIT_TCP_INTERVAL = 0.1
+WAIT_TCP_TIMEOUT = 0.5
+WAIT_BASE_DELAY = 0.1
+WAIT_MAX_DELAY = 2.0
+WAIT_JITTER = 0.05
+
+# Таблица users. {table} - TABLE или UNLOGGED TABLE (см. PostgresInitializer,
+# параметр logged)
+CREATE_USERS_DDL = """
+    CREATE {table} IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY,
+        first_name VARCHAR(100),
+        last_name VARCHAR(100),
+        gender CHAR(1),
+        birth_date DATE,
+        email VARCHAR(255),
+        phone VARCHAR(20),
+        inn VARCHAR(12),
+        insurance_policy VARCHAR(20),
+        city VARCHAR(100),
+        marital_status VARCHAR(20),
+        status VARCHAR(20),
+        balance DECIMAL(18,2),
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP,
+        description TEXT
+    );
+"""
+
+# Индексы для производительности - строятся после загрузки данных: один
+# проход с сортировкой вместо обновления btree на каждую вставленную строку
+CREATE_USERS_INDEXES_SQL = """
+    SET LOCAL maintenance_work_mem = '256MB';
+    CREATE INDEX IF NOT EXISTS idx_users_status ON users(status);
+    CREATE INDEX IF NOT EXISTS idx_users_city ON users(city);
+    CREATE INDEX IF NOT EXISTS idx_users_balance ON users(balance);
+"""
+
+# Колонки users в порядке DDL - общий список для загрузчиков (COPY в
+# generate_test_data.py), чтобы порядок полей не дублировался по скриптам
+USERS_COLUMNS = [
+    'id', 'first_name', 'last_name', 'gender', 'birth_date',
+    'email', 'phone', 'inn', 'insurance_policy', 'city',
+    'marital_status', 'status', 'balance', 'created_at', 'updated_at', 'description',
+]
+
+# БД для создания: (имя, владелец, пароль, описание)
+DATABASES = [
+    ('tdtp_test', 'tdtp_user', 'tdtp_pass', 'Основная тестовая БД'),
+    ('tdtp_target', 'tdtp_user', 'tdtp_pass', 'Целевая БД для импорта'),
+]
+
+# Шаблон с готовыми таблицами: тестовые БД клонируются из него
+# (CREATE DATABASE ... TEMPLATE - копирование файлов вместо повтора DDL)
+TEMPLATE_DATABASE = 'tdtp_template'
+
+# Шаблоны DDL собираются один раз; имена подставляются через
+# sql.Identifier, значения - через sql.Literal (с экранированием)
+CREATE_USER_SQL = sql.SQL("""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT FROM pg_user WHERE usename = {name}) THEN
+            CREATE USER {user} WITH PASSWORD {password};
+        END IF;
+    END
+    $$;
+""")
+DROP_DATABASE_SQL = sql.SQL("DROP DATABASE IF EXISTS {db} WITH (FORCE);")
+CREATE_DATABASE_SQL = sql.SQL("CREATE DATABASE {db} OWNER {owner} TEMPLATE {template};")
+GRANT_DATABASE_SQL = sql.SQL("GRANT ALL PRIVILEGES ON DATABASE {db} TO {user};")
 
 
 class PostgresInitializer:
-    def __init__(self, host='localhost', port=5432, admin_user='postgres', admin_password='postgres'):
+    def __init__(self, host='localhost', port=5432, admin_user='postgres', admin_password='postgres',
+                 logged=False):
         self.host = host
         self.port = port
         self.admin_user = admin_user
         self.admin_password = admin_password
+        # Тестовые данные перегенерируются при каждом запуске, поэтому по
+        # умолчанию users - UNLOGGED: загрузка без записи в WAL. logged=True
+        # возвращает обычную таблицу (для тестов на сохранность данных)
+        self.users_ddl = CREATE_USERS_DDL.format(table='TABLE' if logged else 'UNLOGGED TABLE')
+        # Соединение проверки готовности переиспользуется для создания БД
+        self._admin_conn = None
 
-    def wait_for_postgres(self, max_attempts=30):
+    def connect_admin(self):
+        """Соединение администратора с БД postgres"""
+        return psycopg2.connect(
+            host=self.host,
+            port=self.port,
+            user=self.admin_user,
+            password=self.admin_password,
+            database='postgres'
+        )
+
+    def tcp_ready(self):
+        """Открыт ли порт PostgreSQL - TCP-рукопожатие без startup-пакета и аутентификации"""
+        if self.host.startswith('/'):
+            # Каталог unix-сокета: проверять TCP нечего
+            return True
+        try:
+            socket.create_connection((self.host, self.port), timeout=WAIT_TCP_TIMEOUT).close()
+            return True
+        except OSError:
+            return False
+
+    def wait_for_postgres(self, timeout=WAIT_TIMEOUT):
         """Ожидание готовности PostgreSQL"""
         print(f"Ожидание PostgreSQL на {self.host}:{self.port}...")
 
-        for attempt in range(max_attempts):
-            try:
-                conn = psycopg2.connect(
-                    host=self.host,
-                    port=self.port,
-                    user=self.admin_user,
-                    password=self.admin_password,
-                    database='postgres'
-                )
-                conn.close()
-                print("✓ PostgreSQL готов!")
-                return True
-            except psycopg2.OperationalError:
-                print(f"  Попытка {attempt + 1}/{max_attempts}...", end='\r')
-                time.sleep(2)
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        failed_connects = 0
+        while True:
+            attempt += 1
+            if not self.tcp_ready():
+                delay = WAIT_TCP_INTERVAL
+            else:
+                try:
+                    self._admin_conn = self.connect_admin()
+                    print("✓ PostgreSQL готов!")
+                    return True
+                except psycopg2.OperationalError:
+                    # Порт открыт, но сервер ещё запускается
+                    failed_connects += 1
+                    delay = min(WAIT_MAX_DELAY, WAIT_BASE_DELAY * 2 ** failed_connects)
+
+            print(f"  Попытка {attempt}...", end='\r')
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay + random.uniform(0, WAIT_JITTER), remaining))
 
         print("\n✗ Не удалось подключиться к PostgreSQL")
         return False
@@ -44,94 +160,137 @@ class PostgresInitializer:
         """Создание БД и пользователей"""
         print("\nСоздание баз данных и пользователей...")
 
-        conn = psycopg2.connect(
-            host=self.host,
-            port=self.port,
-            user=self.admin_user,
-            password=self.admin_password,
-            database='postgres'
-        )
+        # Соединение от wait_for_postgres, если оно было - без нового
+        # TCP-подключения и аутентификации
+        conn = self._admin_conn or self.connect_admin()
+        self._admin_conn = None
         conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
         cursor = conn.cursor()
 
-        # Список БД для создания
-        databases = [
-            ('tdtp_test', 'tdtp_user', 'tdtp_pass', 'Основная тестовая БД'),
-            ('tdtp_target', 'tdtp_user', 'tdtp_pass', 'Целевая БД для импорта'),
-        ]
-
-        for db_name, db_user, db_pass, description in databases:
+        # Пользователи - один раз на каждого, а не на каждую БД
+        users = dict.fromkeys((db_user, db_pass) for _, db_user, db_pass, _ in DATABASES)
+        for db_user, db_pass in users:
             # Создание пользователя (если не существует)
-            cursor.execute(f"""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (SELECT FROM pg_user WHERE usename = '{db_user}') THEN
-                        CREATE USER {db_user} WITH PASSWORD '{db_pass}';
-                    END IF;
-                END
-                $$;
-            """)
+            cursor.execute(CREATE_USER_SQL.format(
+                name=sql.Literal(db_user),
+                user=sql.Identifier(db_user),
+                password=sql.Literal(db_pass),
+            ))
             print(f"  ✓ Пользователь {db_user}")
 
-            # Удаление БД если существует (для чистого теста)
-            cursor.execute(f"DROP DATABASE IF EXISTS {db_name};")
+        # Шаблон с таблицами (создаётся при первом запуске)
+        self.ensure_template(cursor, DATABASES[0][1])
 
-            # Создание БД
-            cursor.execute(f"CREATE DATABASE {db_name} OWNER {db_user};")
+        cursor.close()
+        conn.close()
+
+        # БД пересоздаются параллельно, каждая на своём соединении:
+        # DROP/CREATE DATABASE нельзя выполнять в одной транзакции, а
+        # сервер обрабатывает их независимо
+        with ThreadPoolExecutor(max_workers=len(DATABASES)) as executor:
+            list(executor.map(self.recreate_database, DATABASES))
+
+        for db_name, _, _, description in DATABASES:
             print(f"  ✓ База данных {db_name} ({description})")
 
-            # Выдача прав
-            cursor.execute(f"GRANT ALL PRIVILEGES ON DATABASE {db_name} TO {db_user};")
+    def recreate_database(self, database):
+        """Пересоздание БД из шаблона на отдельном соединении"""
+        db_name, db_user, _, _ = database
+
+        conn = self.connect_admin()
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        cursor = conn.cursor()
+
+        # Удаление БД если существует (для чистого теста); FORCE (PostgreSQL 13+)
+        # отключает оставшиеся сессии вместо ожидания их закрытия
+        cursor.execute(DROP_DATABASE_SQL.format(db=sql.Identifier(db_name)))
+
+        # Создание БД - клон шаблона с готовой таблицей
+        cursor.execute(CREATE_DATABASE_SQL.format(
+            db=sql.Identifier(db_name),
+            owner=sql.Identifier(db_user),
+            template=sql.Identifier(TEMPLATE_DATABASE),
+        ))
+
+        # Выдача прав
+        cursor.execute(GRANT_DATABASE_SQL.format(
+            db=sql.Identifier(db_name),
+            user=sql.Identifier(db_user),
+        ))
 
         cursor.close()
         conn.close()
 
-    def create_tables(self, database):
-        """Создание таблиц в указанной БД"""
-        print(f"\nСоздание таблиц в {database}...")
+    def ensure_template(self, cursor, owner):
+        """Создание шаблонной БД с таблицами, если её ещё нет.
+
+        В комментарии к шаблону хранится отпечаток DDL таблиц: при
+        изменении DDL (в том числе logged/unlogged) шаблон пересоздаётся,
+        иначе используется как есть.
+        """
+        fingerprint = hashlib.sha1(self.users_ddl.encode('utf-8')).hexdigest()
+
+        cursor.execute(
+            "SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = %s;",
+            (TEMPLATE_DATABASE,)
+        )
+        row = cursor.fetchone()
+        if row and row[0] == fingerprint:
+            return
+
+        template = sql.Identifier(TEMPLATE_DATABASE)
+        if row:
+            cursor.execute(sql.SQL("ALTER DATABASE {} IS_TEMPLATE false;").format(template))
+            cursor.execute(sql.SQL("DROP DATABASE {};").format(template))
 
-        conn = psycopg2.connect(
+        cursor.execute(sql.SQL("CREATE DATABASE {} OWNER {};").format(template, sql.Identifier(owner)))
+        self.create_tables(TEMPLATE_DATABASE)
+        cursor.execute(sql.SQL("ALTER DATABASE {} IS_TEMPLATE true;").format(template))
+        cursor.execute(sql.SQL("COMMENT ON DATABASE {} IS %s;").format(template), (fingerprint,))
+        print(f"  ✓ Шаблон {TEMPLATE_DATABASE}")
+
+    def connect_user(self, database):
+        """Соединение tdtp_user с указанной БД"""
+        return psycopg2.connect(
             host=self.host,
             port=self.port,
             user='tdtp_user',
             password='tdtp_pass',
             database=database
         )
+
+    def create_tables(self, database):
+        """Создание таблиц в указанной БД"""
+        print(f"\nСоздание таблиц в {database}...")
+
+        conn = self.connect_user(database)
         cursor = conn.cursor()
 
-        # Таблица Users
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY,
-                first_name VARCHAR(100),
-                last_name VARCHAR(100),
-                gender CHAR(1),
-                birth_date DATE,
-                email VARCHAR(255),
-                phone VARCHAR(20),
-                inn VARCHAR(12),
-                insurance_policy VARCHAR(20),
-                city VARCHAR(100),
-                marital_status VARCHAR(20),
-                status VARCHAR(20),
-                balance DECIMAL(18,2),
-                created_at TIMESTAMP,
-                updated_at TIMESTAMP,
-                description TEXT
-            );
-        """)
+        cursor.execute(self.users_ddl)
         print("  ✓ Таблица users")
 
-        # Индексы для производительности
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_status ON users(status);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_city ON users(city);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_balance ON users(balance);")
-        print("  ✓ Индексы созданы")
-
         conn.commit()
         cursor.close()
         conn.close()
 
+    def create_indexes(self):
+        """Создание индексов во всех тестовых БД.
+
+        Вызывается после загрузки данных (см. setup_all.py): индексы
+        строятся по уже заполненной таблице. Все индексы БД - один запрос
+        в одной транзакции, SET LOCAL действует только на неё.
+        """
+        print("\nСоздание индексов...")
+
+        for db_name, _, _, _ in DATABASES:
+            conn = self.connect_user(db_name)
+            cursor = conn.cursor()
+            cursor.execute(CREATE_USERS_INDEXES_SQL)
+            conn.commit()
+            cursor.close()
+            conn.close()
+            print(f"  ✓ Индексы в {db_name}")
+
     def show_connection_info(self):
         """Показать информацию для подключения"""
         print("\n" + "=" * 60)
@@ -161,8 +320,12 @@ class PostgresInitializer:
         print("      user='tdtp_user', password='tdtp_pass',")
         print("      database='tdtp_test')")
 
-    def run(self):
-        """Выполнить всю инициализацию"""
+    def run(self, with_indexes=True):
+        """Выполнить всю инициализацию.
+
+        with_indexes=False откладывает индексы: их создаёт вызывающий код
+        через create_indexes() после загрузки данных.
+        """
         print("=" * 60)
         print("ИНИЦИАЛИЗАЦИЯ POSTGRESQL ДЛЯ TDTP FRAMEWORK")
         print("=" * 60)
@@ -174,9 +337,9 @@ class PostgresInitializer:
         # Создание БД и пользователей
         self.create_databases_and_users()
 
-        # Создание таблиц в обеих БД
-        self.create_tables('tdtp_test')
-        self.create_tables('tdtp_target')
+        # Таблицы в tdtp_test и tdtp_target уже есть - БД клонированы из шаблона
+        if with_indexes:
+            self.create_indexes()
 
         # Показать информацию
         self.show_connection_info()
@@ -185,5 +348,5 @@ class PostgresInitializer:
 
 
 if __name__ == '__main__':
-    initializer = PostgresInitializer()
+    initializer = PostgresInitializer(logged='--logged' in sys.argv[1:])
     initializer.run()
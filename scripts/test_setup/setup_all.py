@@ -4,16 +4,35 @@
 Запускает все шаги по порядку
 """
 
+import shutil
 import subprocess
 import sys
 import time
+import traceback
 from pathlib import Path
 
+# Сервисы и контейнеры из generate_docker_compose.py
+SERVICE_NAMES = ['postgres', 'rabbitmq', 'kafka', 'zookeeper']
+SERVICE_CONTAINERS = ['tdtp_postgres', 'tdtp_rabbitmq', 'tdtp_kafka', 'tdtp_zookeeper']
+
+# Статус для опроса: health, если у контейнера есть healthcheck, иначе State
+CONTAINER_STATUS_FORMAT = '{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}}{{end}}'
+
+# Статусы упавшего контейнера: ждать дальше бессмысленно (restarting -
+# перезапуск по restart policy после падения, например порт уже занят)
+CONTAINER_FAILED_STATUSES = ('exited', 'dead', 'restarting')
+
+# Сколько последних строк лога показать для упавшего контейнера
+FAILED_LOG_TAIL = 50
+
 
 class TestSetup:
     def __init__(self):
         self.scripts_dir = Path(__file__).parent
         self.project_root = self.scripts_dir.parent.parent
+        # Скрипты шагов импортируются как модули из этой же папки
+        if str(self.scripts_dir) not in sys.path:
+            sys.path.insert(0, str(self.scripts_dir))
 
     def run_command(self, cmd, check=True):
         """Запуск команды в shell"""
@@ -36,20 +55,44 @@ class TestSetup:
             return False
         return True
 
+    def run_in_process(self, title, func):
+        """Запуск шага в текущем процессе.
+
+        Скрипты шагов импортируются как модули и вызываются напрямую:
+        без нового интерпретатора и повторного импорта psycopg2/yaml/numpy
+        на каждый шаг. sys.exit внутри шага и исключения превращаются в
+        False, как ненулевой код возврата у отдельного процесса.
+        """
+        print(f"\n{'=' * 80}")
+        print(f"Запуск: {title}")
+        print('=' * 80)
+        try:
+            func()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"✗ Шаг завершился с ошибкой: {e.code}")
+                return False
+        except Exception as e:
+            print(f"✗ Шаг завершился с ошибкой: {e}")
+            traceback.print_exc()
+            return False
+        return True
+
     def check_docker(self):
         """Проверка наличия Docker"""
         print("\n" + "=" * 80)
         print("ШАГ 1: ПРОВЕРКА DOCKER")
         print("=" * 80)
 
-        if not self.run_command("docker --version", check=False):
+        # Поиск в PATH вместо запуска `docker --version`/`docker-compose --version`
+        if not shutil.which("docker"):
             print("✗ Docker не установлен!")
             print("\nУстановите Docker:")
             print("  Windows: https://docs.docker.com/desktop/install/windows-install/")
             print("  Linux: https://docs.docker.com/engine/install/")
             return False
 
-        if not self.run_command("docker-compose --version", check=False):
+        if not shutil.which("docker-compose"):
             print("✗ docker-compose не установлен!")
             return False
 
@@ -61,42 +104,122 @@ class TestSetup:
         print("\n" + "=" * 80)
         print("ШАГ 2: ГЕНЕРАЦИЯ DOCKER-COMPOSE.YML")
         print("=" * 80)
-        return self.run_python_script("generate_docker_compose.py")
+        def generate():
+            from generate_docker_compose import generate_docker_compose
+            generate_docker_compose()
+
+        return self.run_in_process("generate_docker_compose.py", generate)
+
+    def running_services(self):
+        """Имена сервисов docker-compose в состоянии running"""
+        result = subprocess.run(
+            ['docker-compose', 'ps', '--services', '--filter', 'status=running'],
+            capture_output=True, text=True, cwd=self.project_root
+        )
+        if result.returncode != 0:
+            return set()
+        return set(result.stdout.split())
 
-    def start_docker_services(self):
+    def start_docker_services(self, force_restart=False):
         """Запуск Docker контейнеров"""
         print("\n" + "=" * 80)
         print("ШАГ 3: ЗАПУСК DOCKER КОНТЕЙНЕРОВ")
         print("=" * 80)
 
-        print("\nОстановка существующих контейнеров...")
-        self.run_command("docker-compose down", check=False)
-
-        print("\nЗапуск новых контейнеров...")
+        # Уже запущенные контейнеры не пересоздаются: иначе PostgreSQL
+        # заново проходит инициализацию и прогрев кэша
+        if not force_restart and set(SERVICE_NAMES) <= self.running_services():
+            print("\n✓ Контейнеры уже запущены, перезапуск не нужен (--force-restart для перезапуска)")
+            return self.wait_services_ready(SERVICE_CONTAINERS)
+
+        # Без --force-restart контейнеры не удаляются: up -d сам сверяет
+        # config-hash каждого сервиса, остановленные с прежней конфигурацией
+        # просто запускает, а пересоздаёт только изменённые. Данные PostgreSQL
+        # в именованном томе postgres_data переживают и down (без -v)
+        if force_restart:
+            print("\nОстановка существующих контейнеров...")
+            self.run_command("docker-compose down", check=False)
+
+        print("\nЗапуск контейнеров...")
         if not self.run_command("docker-compose up -d"):
             return False
 
-        print("\nОжидание готовности сервисов (30 сек)...")
-        time.sleep(30)
+        print("\nОжидание готовности сервисов...")
+        if not self.wait_services_ready(SERVICE_CONTAINERS):
+            return False
 
         print("\nПроверка статуса контейнеров:")
         self.run_command("docker-compose ps")
 
         return True
 
-    def init_postgres(self):
+    def wait_services_ready(self, containers, timeout=60):
+        """Опрос состояния контейнеров до готовности всех.
+
+        Готов - healthy по healthcheck, а без healthcheck - running.
+        Все контейнеры опрашиваются одним docker inspect; пауза между
+        опросами растёт от 0.2 до 2 с. Упавший контейнер прерывает
+        ожидание сразу: печатается хвост его лога и возвращается False.
+        По таймауту - предупреждение и True (продолжаем как есть).
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        attempt = 0
+        while True:
+            result = subprocess.run(
+                ['docker', 'inspect', '-f', CONTAINER_STATUS_FORMAT, *containers],
+                capture_output=True, text=True
+            )
+            statuses = result.stdout.split()
+            if result.returncode == 0 and len(statuses) == len(containers):
+                if all(status in ('healthy', 'running') for status in statuses):
+                    print(f"✓ Сервисы готовы за {time.monotonic() - start:.1f} сек")
+                    return True
+
+                failed = [(container, status) for container, status in zip(containers, statuses)
+                          if status in CONTAINER_FAILED_STATUSES]
+                if failed:
+                    for container, status in failed:
+                        print(f"\n✗ Контейнер {container}: {status}")
+                        self.show_container_logs(container)
+                    return False
+
+            now = time.monotonic()
+            if now >= deadline:
+                print("⚠ Сервисы не стали готовы вовремя, продолжаем")
+                return True
+            time.sleep(min(2.0, 0.2 * 2 ** attempt, deadline - now))
+            attempt += 1
+
+    def show_container_logs(self, container, tail=FAILED_LOG_TAIL):
+        """Последние строки лога контейнера"""
+        print(f"--- docker logs --tail {tail} {container} ---")
+        subprocess.run(['docker', 'logs', '--tail', str(tail), container],
+                       stderr=subprocess.STDOUT)
+        print("---")
+
+    def init_postgres(self, logged=False):
         """Инициализация PostgreSQL"""
         print("\n" + "=" * 80)
         print("ШАГ 4: ИНИЦИАЛИЗАЦИЯ POSTGRESQL")
         print("=" * 80)
-        return self.run_python_script("init_postgres.py")
+        def initialize():
+            from init_postgres import PostgresInitializer
+            # Индексы - отдельным шагом после загрузки данных
+            PostgresInitializer(logged=logged).run(with_indexes=False)
+
+        return self.run_in_process("init_postgres.py", initialize)
 
     def generate_configs(self):
         """Генерация конфигурационных файлов"""
         print("\n" + "=" * 80)
         print("ШАГ 5: ГЕНЕРАЦИЯ КОНФИГУРАЦИОННЫХ ФАЙЛОВ")
         print("=" * 80)
-        return self.run_python_script("generate_configs.py")
+        def generate():
+            from generate_configs import ConfigGenerator
+            ConfigGenerator().generate_all()
+
+        return self.run_in_process("generate_configs.py", generate)
 
     def generate_test_data(self, count=10000):
         """Генерация тестовых данных"""
@@ -104,10 +227,25 @@ class TestSetup:
         print("ШАГ 6: ГЕНЕРАЦИЯ ТЕСТОВЫХ ДАННЫХ")
         print("=" * 80)
 
-        script_path = self.scripts_dir / "generate_test_data.py"
-        result = subprocess.run([sys.executable, str(script_path), "--count", str(count)])
+        def generate():
+            from generate_test_data import TestDataGenerator
+            generator = TestDataGenerator()
+            generator.generate_batch(count=count)
+            generator.show_sample(limit=5)
 
-        return result.returncode == 0
+        return self.run_in_process("generate_test_data.py", generate)
+
+    def create_indexes(self):
+        """Создание индексов после загрузки данных"""
+        print("\n" + "=" * 80)
+        print("ШАГ 7: СОЗДАНИЕ ИНДЕКСОВ")
+        print("=" * 80)
+
+        def create():
+            from init_postgres import PostgresInitializer
+            PostgresInitializer().create_indexes()
+
+        return self.run_in_process("init_postgres.create_indexes", create)
 
     def show_summary(self):
         """Показать итоговую информацию"""
@@ -155,7 +293,8 @@ class TestSetup:
         print("  docker-compose down")
         print("  docker-compose down -v  # с удалением данных")
 
-    def run_all(self, skip_docker=False, skip_data=False, data_count=10000):
+    def run_all(self, skip_docker=False, skip_data=False, data_count=10000,
+                force_restart=False, logged=False):
         """Запуск всех шагов"""
         print("=" * 80)
         print("ПОЛНАЯ НАСТРОЙКА ТЕСТОВОГО ОКРУЖЕНИЯ TDTP FRAMEWORK")
@@ -164,10 +303,11 @@ class TestSetup:
         steps = [
             ("Проверка Docker", self.check_docker, not skip_docker),
             ("Генерация docker-compose.yml", self.generate_docker_compose, not skip_docker),
-            ("Запуск Docker контейнеров", self.start_docker_services, not skip_docker),
-            ("Инициализация PostgreSQL", self.init_postgres, True),
+            ("Запуск Docker контейнеров", lambda: self.start_docker_services(force_restart), not skip_docker),
+            ("Инициализация PostgreSQL", lambda: self.init_postgres(logged), True),
             ("Генерация конфигов", self.generate_configs, True),
             ("Генерация тестовых данных", lambda: self.generate_test_data(data_count), not skip_data),
+            ("Создание индексов", self.create_indexes, True),
         ]
 
         for step_name, step_func, should_run in steps:
@@ -195,6 +335,10 @@ def main():
                         help='Пропустить генерацию тестовых данных')
     parser.add_argument('--count', type=int, default=10000,
                         help='Количество тестовых записей (по умолчанию: 10000)')
+    parser.add_argument('--force-restart', action='store_true',
+                        help='Пересоздать контейнеры, даже если они уже запущены')
+    parser.add_argument('--logged', action='store_true',
+                        help='Обычная (LOGGED) таблица users вместо UNLOGGED - для тестов на сохранность данных')
 
     args = parser.parse_args()
 
@@ -202,7 +346,9 @@ def main():
     success = setup.run_all(
         skip_docker=args.skip_docker,
         skip_data=args.skip_data,
-        data_count=args.count
+        data_count=args.count,
+        force_restart=args.force_restart,
+        logged=args.logged
     )
 
     sys.exit(0 if success else 1)